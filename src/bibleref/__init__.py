@@ -191,11 +191,13 @@ def bible_data():
     The default Bible data is obtained from the `bibleref.data` submodule, but can be changed by setting properties
     on this singleton.
     '''
+    if _bible_data is None:
+        from . import ref   # Loading the ref submodule also loads the data submodule
     return _bible_data
 
 _bible_data = None  # Will be set by data submodule.
 
-flags = None # Will be set by ref submodule.
+flags: 'BibleFlag'  # Will be set by ref submodule, which is loaded on first access.
 '''Global package attribute that is a `bibleref.ref.BibleFlag` enum whose elements control package-wide behaviour.
 Many methods take a `flags` keyword-argument that overrides this global `flags` attribute during the
 execution of that method.
@@ -205,4 +207,19 @@ class BibleRefException(Exception):
     '''Parent class for all Exception types in this package.'''
 
 
-from .ref import BibleBook, BibleVerse, BibleRange, BibleRangeList, BibleRef, BibleFlag, BibleVersePart
+# The ref submodule (and the Lark parser it depends on) is only loaded once one of its names is first accessed.
+_ref_names = {'BibleBook', 'BibleVerse', 'BibleRange', 'BibleRangeList', 'BibleRef', 'BibleFlag', 'BibleVersePart'}
+
+__all__ = ['bible_data', 'flags', 'BibleRefException', 'BibleBook', 'BibleVerse', 'BibleRange', 'BibleRangeList',
+           'BibleRef', 'BibleFlag', 'BibleVersePart']
+
+def __getattr__(name):
+    if name in _ref_names or name == 'flags':
+        from . import ref   # Sets the global flags attribute
+        value = getattr(ref, name) if name in _ref_names else globals()[name]
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,5 +1,9 @@
 
+from array import array
+from itertools import accumulate
+import contextlib
 import re
+from types import MappingProxyType
 
 import bibleref
 from bibleref import ref, parser
@@ -18,8 +22,40 @@ class BibleData:
         self._verse_sep_alt     = "."
         self._book_order        = []
         self._name_data         = {}
-        self._max_verses        = {}
+        self._max_verses        = MappingProxyType({})
         self._verse_0s          = {}    
+        self._book_names        = {}    # Lookup of normalised book names/abbrevs to BibleBooks
+        self._book_regex        = None  # Single regex combining every book's regex, with a named group per book
+        self._batch_depth       = 0     # Nesting depth of batch_update() blocks
+        self._parser_stale      = False # True if separators changed during a batch update
+
+    @contextlib.contextmanager
+    def batch_update(self):
+        '''Context manager that defers rebuilding the parser until the end of the block.
+
+        Changing a separator normally rebuilds the parser straight away. When changing several
+        separators at once, do so inside a `batch_update()` block so that the parser is only
+        rebuilt once, on exit:
+
+            with bible_data().batch_update():
+                bible_data().range_sep = "_"
+                bible_data().major_list_sep = "|"
+        '''
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._parser_stale:
+                self._parser_stale = False
+                parser._recreate_parser()
+
+    def _separators_changed(self):
+        '''Rebuilds the parser after a separator has changed, unless inside a `batch_update()`.'''
+        if self._batch_depth > 0:
+            self._parser_stale = True
+        else:
+            parser._recreate_parser()
 
     @property
     def range_sep(self):
@@ -29,7 +65,7 @@ class BibleData:
     @range_sep.setter
     def range_sep(self, value):
         self._range_sep = value
-        parser._recreate_parser()
+        self._separators_changed()
 
     @property
     def major_list_sep(self):
@@ -41,7 +77,7 @@ class BibleData:
     @major_list_sep.setter
     def major_list_sep(self, value):
         self._major_list_sep = value
-        parser._recreate_parser()
+        self._separators_changed()
 
     @property
     def minor_list_sep(self):
@@ -53,7 +89,7 @@ class BibleData:
     @minor_list_sep.setter
     def minor_list_sep(self, value):
         self._minor_list_sep = value
-        parser._recreate_parser()
+        self._separators_changed()
 
     @property
     def verse_sep_std(self):
@@ -63,7 +99,7 @@ class BibleData:
     @verse_sep_std.setter
     def verse_sep_std(self, value):
         self._verse_sep_std = value
-        parser._recreate_parser()
+        self._separators_changed()
 
     @property
     def verse_sep_alt(self):
@@ -73,7 +109,7 @@ class BibleData:
     @verse_sep_alt.setter
     def verse_sep_alt(self, value):
         self._verse_sep_alt = value
-        parser._recreate_parser()
+        self._separators_changed()
 
     @property
     def book_order(self):
@@ -85,6 +121,7 @@ class BibleData:
     @book_order.setter
     def book_order(self, book_order_list: list):
         self._book_order = book_order_list
+        parser._clear_parse_cache()
         book_set = set(ref.BibleBook)
         for i in range(len(self._book_order)):
             self._book_order[i].order = i
@@ -93,6 +130,13 @@ class BibleData:
         for book in book_set:
             # print(f"No order for {book}")
             book.order = None
+        # Store each book's neighbours, so that next() and prev() needn't index into the book order
+        for book in ref.BibleBook:
+            book._next = None
+            book._prev = None
+        for prev_book, next_book in zip(self._book_order, self._book_order[1:]):
+            prev_book._next = next_book
+            next_book._prev = prev_book
 
     @property
     def name_data(self):
@@ -103,8 +147,10 @@ class BibleData:
     @name_data.setter
     def name_data(self, name_data: dict):
         self._name_data = name_data
+        parser._clear_parse_cache()
         self._set_abbrevs_and_titles(self._name_data)
         self._set_regexes(self._name_data)
+        self._set_book_names(self._name_data)
 
     def _set_abbrevs_and_titles(self, name_data: dict):
         for book in ref.BibleBook:
@@ -169,21 +215,93 @@ class BibleData:
                     total_pattern += "|" + abbrev
                 book.regex = re.compile(total_pattern, re.IGNORECASE)
 
+        # Combine the books' regexes in book order, so that a single match finds the same book as trying each
+        # regex in turn. The named group for the book is the last group to close, so becomes the match's lastgroup.
+        book_patterns = [f"(?P<{book.name}>{book.regex.pattern})" for book in ref.BibleBook if book.regex is not None]
+        self._book_regex = re.compile("|".join(book_patterns), re.IGNORECASE) if book_patterns else None
+
+    def _set_book_names(self, name_data: dict):
+        '''Build a dictionary mapping every acceptable name for each book to the BibleBook, so that
+        `BibleBook.from_str()` can usually find a book with a single lookup rather than trying each book's regex.
+
+        The names are those matched by the regexes from `_set_regexes()`, lower-cased and with each run of
+        whitespace reduced to a single space. Where a name is acceptable for more than one book, the first book
+        wins, as it does when the regexes are tried in order.
+        '''
+        book_names = {}
+        for book in ref.BibleBook:
+            if book not in name_data:
+                continue
+            book_name_data = name_data[book]
+            full_title = book_name_data[1].lower()
+            min_chars = book_name_data[2]
+            extra_abbrevs = book_name_data[3]
+
+            # Variations on any numeric prefix, as in _set_regexes()
+            prefixes = [""]
+            if full_title[0:2] in ("1 ", "2 ", "3 "):
+                numeral = "i" * int(full_title[0])
+                prefixes = [full_title[0] + " ", full_title[0], numeral + " "]
+                full_title = full_title[2:]
+
+            names = []
+            for length in range(min_chars, len(full_title)+1):
+                title_prefix = full_title[0:length].rstrip()
+                names.extend(prefix + title_prefix for prefix in prefixes)
+
+            # Spaces in the extra abbrevs are optional
+            for abbrev in extra_abbrevs:
+                variants = [""]
+                for word in abbrev.lower().split():
+                    variants = [variant + word for variant in variants] + \
+                               [variant + " " + word for variant in variants if variant != ""]
+                names.extend(variants)
+
+            for name in names:
+                book_names.setdefault(name, book)
+        self._book_names = book_names
+
     @property
     def max_verses(self):
         '''Dictionary of max verse numbers for each Bible book and chapter, in the format of `default_max_verses`.
+
+        The dictionary returned is a read-only copy, with a tuple of max verse numbers for each book. To change the
+        data, assign a new dictionary to this property.
         '''
         return self._max_verses
 
     @max_verses.setter
     def max_verses(self, max_verses: dict):
-        self._max_verses = max_verses
+        # Keep a read-only copy, as the books work from packed copies of the numbers, so in-place edits would be
+        # silently ignored.
+        self._max_verses = MappingProxyType({book: tuple(book_max_verses)
+                                             for (book, book_max_verses) in max_verses.items()})
+        parser._clear_parse_cache()
+
+        # Pack all the max verse numbers into a single flat array, and give each book a view of its own
+        # chapters. This avoids keeping a boxed int object for every chapter of the Bible.
+        books = [book for book in ref.BibleBook if book in self._max_verses]
+        all_max_verses = [max_verse for book in books for max_verse in self._max_verses[book]]
+        typecode = 'B' if max(all_max_verses, default=0) <= 0xFF else 'L'
+        flat_view = memoryview(array(typecode, all_max_verses))
+        offset = 0
         for book in ref.BibleBook:
             if book not in self._max_verses:
                 # print(f"No max_verses for {book}")
                 book._max_verses = None
+                book._chap_verse_offsets = None
+                book._min_chap_num = 0
+                book._max_chap_num = 0
             else:
-                book._max_verses = self._max_verses[book]
+                chap_count = len(self._max_verses[book])
+                book._max_verses = flat_view[offset:offset+chap_count]
+                book._chap_verse_offsets = [0] + list(accumulate(book._max_verses))
+                book._min_chap_num = 1
+                book._max_chap_num = chap_count
+                offset += chap_count
+            book._chap_count = book._max_chap_num - book._min_chap_num + 1
+            book._is_single_chap = (book._chap_count == 1)
+            book._edge_verses = {}
 
     @property
     def verse_0s(self):
@@ -195,11 +313,13 @@ class BibleData:
     @verse_0s.setter
     def verse_0s(self, verse_0s: dict):
         self._verse_0s = verse_0s
+        parser._clear_parse_cache()
         for book in ref.BibleBook:
             if book in verse_0s:
                 book._verse_0s = self._verse_0s[book]
             else:
                 book._verse_0s = set()
+            book._edge_verses = {}
 
 
 default_book_order = [
@@ -448,3 +568,4 @@ bibleref._bible_data.book_order = default_book_order
 bibleref._bible_data.name_data = default_name_data
 bibleref._bible_data.max_verses = default_max_verses
 bibleref._bible_data.verse_0s = default_verse_0s
+parser._recreate_parser()
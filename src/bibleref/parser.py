@@ -1,48 +1,68 @@
 '''Submodule for parsing strings into Bible references. The contents of this submodule should be considered an
 implementation detail and not relied upon.
 '''
+from __future__ import annotations
+
+import functools
+import re
+import threading
+
 from lark import Lark, UnexpectedInput
 from lark import Transformer, v_args
 from lark.visitors import VisitError
 
-import bibleref
-from bibleref import ref, bible_data
+from bibleref import bible_data
 
 
 MAJOR_LIST_SEP_SENTINEL = object()
-MINOR_LIST_SEP_SENTINEL = object()
 
 
-_parser_obj = None
+_parser_obj = None # Lark parser singleton. Built by _recreate_parser() once the data submodule has loaded.
+_token_regex = None # Compiled regex for the tokenizer used by _Scanner. Also built by _recreate_parser().
+_book_name_cache = {} # BOOK_NAME token text to BibleBook, for the spellings actually seen in parsed strings
+_BOOK_NAME_CACHE_SIZE = 4096
+_thread_local = threading.local() # Each thread gets its own transformer, as it holds the state of the current parse
 
-def _parser():
-    '''Return a Lark parser singleton.'''
-    global _parser_obj
-    if _parser_obj is None:
-        # from pathlib import Path
-        # GRAMMAR_FILE_NAME = "bible-reference.lark"
-        # grammar_path = Path(__file__, "..", GRAMMAR_FILE_NAME).resolve()
-        # with open(grammar_path) as file:
-        #     grammar_text = file.read()
-        _recreate_parser()
-    return _parser_obj
 
+def _parse(string, flags: ref.BibleFlag = None):
+    '''Parse `string` as a `bibleref.ref.BibleRefList` using `BibleRefTransformer`.'''
+    # BibleRanges are immutable, so cached results can be shared. Only the lists are copied.
+    return [list(group) for group in _parse_groups(string, flags)]
 
-_transformer_obj = None
 
-def _transformer():
-    '''Return a Lark Transformer singleton.'''
-    global _transformer_obj
+def _parse_groups(string, flags: ref.BibleFlag = None) -> tuple:
+    '''As for `_parse()`, but returns the cached groups as a tuple of tuples, for callers that only read them.'''
+    return _parse_cached(string, ref._resolve_flags(flags))
 
-    if _transformer_obj is None:
-        _transformer_obj = _BibleRefTransformer()
-    return _transformer_obj
 
+def _clear_parse_cache():
+    '''Discards cached parse results and book names. Called whenever Bible data that affects parsing changes.'''
+    _parse_cached.cache_clear()
+    _book_name_cache.clear()
 
-def _parse(string, flags: ref.BibleFlag = None):
-    '''Parse `string` as a `bibleref.ref.BibleRefList` using `BibleRefTransformer`.'''
+
+@functools.lru_cache(maxsize=4096)
+def _parse_cached(string, flags: ref.BibleFlag) -> tuple:
+    '''Memoized implementation of `_parse()`, returning a tuple of tuples of BibleRanges.'''
+    return tuple(tuple(group) for group in _parse_uncached(string, flags))
+
+
+def _parse_uncached(string, flags: ref.BibleFlag):
+    scanner = _thread_scanner()
+    scanner.reset(flags)
     try:
-        tree = _parser().parse(string)
+        return scanner.scan(string)
+    except ref.BibleRefParsingError as e:
+        # A reference was well-formed but invalid (e.g. no such chapter). Transforming the Lark tree
+        # would raise the same error, so it only remains to check the rest of the string's syntax.
+        scan_error = e
+    except Exception:
+        # Hand over to the Lark parser, which is the reference implementation of the grammar,
+        # so that errors are always reported the same way.
+        scan_error = None
+
+    try:
+        tree = _parser_obj.parse(string)
     except UnexpectedInput as orig:
         start_pos=orig.pos_in_stream
         end_pos=orig.pos_in_stream + 1
@@ -50,21 +70,180 @@ def _parse(string, flags: ref.BibleFlag = None):
                                          start_pos, end_pos)
         new_error.orig = orig
         raise new_error
-    
+    if scan_error is not None:
+        raise scan_error
+
+    # Only reached if the scanner rejects a string that Lark accepts, which shouldn't happen in practice.
+    transformer = scanner.transformer
+    transformer.reset(flags)
     try:
-        flags = flags or bibleref.flags or ref.BibleFlag.NONE
-        _transformer().flags = flags
-        range_groups_list = _transformer().transform(tree)
+        range_groups_list = transformer.transform(tree)
     except VisitError as e:
-        raise e.orig_exc
+        raise e.orig_exc from None
     return range_groups_list
 
 def _meta_info_to_pos(meta_info):
     return (meta_info.start_pos, meta_info.end_pos)
 
+def _new_range(meta, *args, flags: ref.BibleFlag = None) -> ref.BibleRange:
+    '''Returns a new `BibleRange` from `args`, reporting any failure as a `BibleRefParsingError` at the
+    position given by `meta`.'''
+    try:
+        return ref.BibleRange(*args, flags=flags)
+    except Exception as e:
+        raise ref.BibleRefParsingError(str(e), *_meta_info_to_pos(meta))
+
+
+class _ScanError(Exception):
+    '''Raised when a `_Scanner` can't parse a string.'''
+
+
+class _Meta:
+    '''Start and end positions of a rule matched by a `_Scanner`, standing in for a Lark `Meta` object.'''
+    __slots__ = ('start_pos', 'end_pos')
+
+    def __init__(self, start_pos: int, end_pos: int):
+        self.start_pos = start_pos
+        self.end_pos = end_pos
+
+
+class _ScanToken:
+    '''A token found by `_tokenize()`. Lighter-weight than a Lark `Token`, as it's not a `str` subclass.
+
+    The `value` of a `NUM` token is already converted to an `int`.'''
+    __slots__ = ('type', 'value', 'start_pos', 'end_pos')
+
+    def __init__(self, type: str, value, start_pos: int, end_pos: int):
+        self.type = type
+        self.value = value
+        self.start_pos = start_pos
+        self.end_pos = end_pos
+
+
+def _tokenize(string) -> list:
+    '''Splits `string` into a list of `_ScanToken`s, using the same terminals as the grammar.'''
+    tokens = []
+    pos = 0
+    length = len(string)
+    match = _token_regex.match
+    while pos < length:
+        m = match(string, pos)
+        if m is None:
+            raise _ScanError(pos)
+        token_type = m.lastgroup
+        if token_type is None: # Only trailing whitespace was left
+            break
+        value = m.group(token_type)
+        if token_type == 'NUM':
+            value = int(value)
+        tokens.append(_ScanToken(token_type, value, m.start(token_type), m.end(token_type)))
+        pos = m.end()
+    return tokens
+
+
+class _Scanner:
+    '''Hand-written recursive-descent parser for the reference grammar, that drives a `_BibleRefTransformer`
+    directly rather than via a Lark parse tree.'''
+    def __init__(self, transformer: _BibleRefTransformer):
+        self.transformer = transformer
+        # Lark's v_args wrappers are rebuilt on every attribute access, and add a call of their own each
+        # time they're called. So bind the underlying methods of the transformer once.
+        self.reset = transformer.reset.base_func
+        self.ref_list = transformer.ref_list.base_func
+        self.dual_ref = transformer.dual_ref.base_func
+        self.book_only_ref = transformer.book_only_ref.base_func
+        self.book_num_ref = transformer.book_num_ref.base_func
+        self.book_chap_verse_ref = transformer.book_chap_verse_ref.base_func
+        self.chap_verse_ref = transformer.chap_verse_ref.base_func
+        self.num_only_ref = transformer.num_only_ref.base_func
+        self.MAJOR_LIST_SEP = transformer.MAJOR_LIST_SEP.base_func
+        self.book = transformer._book # Called in place of BOOK_NAME. (NUM tokens already hold their int value.)
+
+    def scan(self, string) -> list:
+        '''Parses `string` with a hand-written recursive-descent parser, which is much faster than running
+        the Lark parser.
+
+        The grammar is that given to Lark in `_recreate_parser()`. The transformer methods are called
+        in the same order as when transforming a Lark parse tree, so the results are identical. Raises
+        an exception (usually `_ScanError`) if the string can't be parsed, in which case the caller should
+        fall back to the Lark parser for the proper error.
+        '''
+        tokens = _tokenize(string)
+        token_count = len(tokens)
+        if token_count == 0:
+            raise _ScanError(0)
+
+        # ref_list: bible_ref (list_sep bible_ref)* list_sep?
+        children = []
+        index = 0
+        while index < token_count:
+            (first, first_start_pos, index) = self._single_ref(tokens, index)
+            if index < token_count and tokens[index].type == 'RANGE_SEP':
+                # dual_ref: single_ref RANGE_SEP single_ref
+                range_sep = tokens[index]
+                if index + 1 == token_count:
+                    raise _ScanError(range_sep.start_pos)
+                (second, _, index) = self._single_ref(tokens, index + 1)
+                meta = _Meta(first_start_pos, tokens[index - 1].end_pos)
+                children.append(self.dual_ref(meta, [first, second]))
+            else:
+                children.append(first)
+
+            if index < token_count:
+                token = tokens[index]
+                if token.type == 'MAJOR_LIST_SEP':
+                    children.append(self.MAJOR_LIST_SEP(token))
+                elif token.type != 'MINOR_LIST_SEP':
+                    # Minor list separators are filtered out of the Lark tree, so likewise aren't passed on
+                    raise _ScanError(token.start_pos)
+            index += 1
+        return self.ref_list(_Meta(tokens[0].start_pos, tokens[-1].end_pos), children)
+
+    def _single_ref(self, tokens: list, index: int) -> tuple:
+        '''Parses the `single_ref` rule beginning at `tokens[index]`.
+
+        Returns a tuple of (resulting BibleRange, start position, index of the next token).
+        '''
+        token_count = len(tokens)
+        token = tokens[index]
+        if token.type == 'BOOK_NAME':
+            children = [self.book(token.value, token.start_pos, token.end_pos)]
+            if index + 1 < token_count and tokens[index + 1].type == 'NUM':
+                children.append(tokens[index + 1].value)
+                if index + 2 < token_count and tokens[index + 2].type == 'VERSE_SEP':
+                    if index + 3 == token_count or tokens[index + 3].type != 'NUM':
+                        raise _ScanError(tokens[index + 2].start_pos)
+                    # book_chap_verse_ref: BOOK_NAME NUM VERSE_SEP NUM
+                    children.append(tokens[index + 3].value)
+                    meta = _Meta(token.start_pos, tokens[index + 3].end_pos)
+                    return (self.book_chap_verse_ref(meta, children), token.start_pos, index + 4)
+                # book_num_ref: BOOK_NAME NUM
+                meta = _Meta(token.start_pos, tokens[index + 1].end_pos)
+                return (self.book_num_ref(meta, children), token.start_pos, index + 2)
+            # book_only_ref: BOOK_NAME
+            return (self.book_only_ref(_Meta(token.start_pos, token.end_pos), children),
+                    token.start_pos, index + 1)
+        elif token.type == 'NUM':
+            children = [token.value]
+            if index + 1 < token_count and tokens[index + 1].type == 'VERSE_SEP':
+                if index + 2 == token_count or tokens[index + 2].type != 'NUM':
+                    raise _ScanError(tokens[index + 1].start_pos)
+                # chap_verse_ref: NUM VERSE_SEP NUM
+                children.append(tokens[index + 2].value)
+                meta = _Meta(token.start_pos, tokens[index + 2].end_pos)
+                return (self.chap_verse_ref(meta, children), token.start_pos, index + 3)
+            # num_only_ref: NUM
+            return (self.num_only_ref(_Meta(token.start_pos, token.end_pos), children),
+                    token.start_pos, index + 1)
+        raise _ScanError(token.start_pos)
+
+
 @v_args(meta=True)
 class _BibleRefTransformer(Transformer):
     '''Lark Transformer for parsing strings into Bible references.'''
+    # The parse state is read and written by every rule, so is kept in slots
+    __slots__ = ('cur_book', 'cur_chap_num', 'at_verse_level', 'flags')
+
     def __init__(self, *args, flags: ref.BibleFlag = None, **kwargs):
         super().__init__(*args, **kwargs)
         self.cur_book = None            # Tracks implied current book
@@ -72,177 +251,207 @@ class _BibleRefTransformer(Transformer):
         self.at_verse_level = False     # If try, bare numbers represent verses, otherwise chapters.
         self.flags = flags
 
+    def reset(self, flags: ref.BibleFlag = None):
+        '''Clears the implied book and chapter state, ready to transform a new string.'''
+        self.cur_book = None
+        self.cur_chap_num = None
+        self.at_verse_level = False
+        self.flags = flags
+
     def ref_list(self, meta, children):
         '''Returns a list of group lists.'''
         parent_list = []
         group_list = []
         for child in children:
             if child is MAJOR_LIST_SEP_SENTINEL:
-                if len(group_list) > 0:
+                if group_list:
                     parent_list.append(group_list)
                     group_list = []
-            elif child is MINOR_LIST_SEP_SENTINEL:
-                pass
             else: # It's a BibleRange
                 group_list.append(child)
-        if len(group_list) > 0:
+        if group_list:
             parent_list.append(group_list)
-            group_list = []
         return parent_list
 
-    def dual_ref(self, meta, children): # Children: single_ref RANGE_SEP single_ref
+    def dual_ref(self, meta, children): # Children: single_ref single_ref
         first: ref.BibleRange = children[0]
-        second: ref.BibleRange = children[2]
+        second: ref.BibleRange = children[1]
         # We don't need to update self.cur_book or self.cur_chap_num as they will
         # have already been updated by the parsing of the second BibleRange child.
-        try:
-            bible_range = ref.BibleRange(first.start.book, first.start.chap_num, first.start.verse_num,
-                                               second.end.book, second.end.chap_num, second.end.verse_num,
-                                               flags=self.flags)
-        except Exception as e:
-            raise ref.BibleRefParsingError(str(e), *_meta_info_to_pos(meta))
-        return bible_range
+        return _new_range(meta, first.start.book, first.start.chap_num, first.start.verse_num,
+                          second.end.book, second.end.chap_num, second.end.verse_num, flags=self.flags)
 
     def book_only_ref(self, meta, children): # Children: BOOK_NAME
         book: ref.BibleBook = children[0]
         self.cur_book = book
         self.at_verse_level = False
-        try:
-            bible_range = ref.BibleRange(book, flags=self.flags)
-        except Exception as e:
-            raise ref.BibleRefParsingError(str(e), *_meta_info_to_pos(meta))
-        return bible_range
+        return _new_range(meta, book, flags=self.flags)
         
     def book_num_ref(self, meta, children): # Children: BOOK_NAME NUM
         book: ref.BibleBook = children[0]
         num: int = children[1]
         self.cur_book = book
         # For single-chapter books, bare numbers represent verses instead of chapters
-        is_single_chap = (book.chap_count() == 1)
+        is_single_chap = book._is_single_chap
         self.at_verse_level = is_single_chap
-        try:
-            if is_single_chap:
-                self.cur_chap_num = book.min_chap_num()
-                bible_range = ref.BibleRange(book, self.cur_chap_num, num,
-                                                   flags=self.flags)
-            else:
-                self.cur_chap_num = num
-                bible_range = ref.BibleRange(book, num, flags=self.flags)
-        except Exception as e:
-            raise ref.BibleRefParsingError(str(e), *_meta_info_to_pos(meta))
-        return bible_range
-
-    def book_chap_verse_ref(self, meta, children): # Children: BOOK_NAME NUM VERSE_SEP NUM
+        if is_single_chap:
+            self.cur_chap_num = book._min_chap_num
+            return _new_range(meta, book, self.cur_chap_num, num, flags=self.flags)
+        else:
+            self.cur_chap_num = num
+            return _new_range(meta, book, num, flags=self.flags)
+
+    def book_chap_verse_ref(self, meta, children): # Children: BOOK_NAME NUM NUM
         book: ref.BibleBook = children[0]
         chap_num: int = children[1]
-        verse_num: int = children [3]
+        verse_num: int = children[2]
         self.cur_book = book
         self.cur_chap_num = chap_num
         self.at_verse_level = True
-        try:
-            bible_range = ref.BibleRange(book, chap_num, verse_num, flags=self.flags)
-        except Exception as e:
-            raise ref.BibleRefParsingError(str(e), *_meta_info_to_pos(meta))
-        return bible_range
+        return _new_range(meta, book, chap_num, verse_num, flags=self.flags)
 
-    def chap_verse_ref(self, meta, children): # Children: NUM VERSE_SEP NUM
+    def chap_verse_ref(self, meta, children): # Children: NUM NUM
         if self.cur_book is None:
             raise ref.BibleRefParsingError("No book specified", *_meta_info_to_pos(meta))
         book: ref.BibleBook = self.cur_book
         chap_num: int = children[0]
-        verse_num: int = children [2]
+        verse_num: int = children[1]
         self.cur_chap_num = chap_num
         self.at_verse_level = True
-        try:
-            bible_range = ref.BibleRange(book, chap_num, verse_num, flags=self.flags)
-        except Exception as e:
-            raise ref.BibleRefParsingError(str(e), *_meta_info_to_pos(meta))
-        return bible_range
+        return _new_range(meta, book, chap_num, verse_num, flags=self.flags)
 
     def num_only_ref(self, meta, children): # Children: NUM
         if self.cur_book is None:
             raise ref.BibleRefParsingError("No book specified", *_meta_info_to_pos(meta))
         book: ref.BibleBook = self.cur_book
         num: int = children[0]
-        is_single_chap = (book.chap_count() == 1)
-        try:
-            if self.at_verse_level or is_single_chap: # Book, chapter, verse ref
-                if is_single_chap:
-                    self.cur_chap_num = book.min_chap_num()
-                elif self.cur_chap_num is None:
-                    raise ref.BibleRefParsingError("No chapter specified", *_meta_info_to_pos(meta))
-                bible_range = ref.BibleRange(book, self.cur_chap_num, num, flags=self.flags)
-            else: # Book, chapter ref
-                bible_range = ref.BibleRange(book, num, flags=self.flags)
-        except Exception as e:
-            if isinstance(e, ref.BibleRefParsingError):
-                raise e
-            else:
-                raise ref.BibleRefParsingError(str(e), *_meta_info_to_pos(meta))
-        return bible_range
+        is_single_chap = book._is_single_chap
+        if self.at_verse_level or is_single_chap: # Book, chapter, verse ref
+            if is_single_chap:
+                self.cur_chap_num = book._min_chap_num
+            elif self.cur_chap_num is None:
+                raise ref.BibleRefParsingError("No chapter specified", *_meta_info_to_pos(meta))
+            return _new_range(meta, book, self.cur_chap_num, num, flags=self.flags)
+        else: # Book, chapter ref
+            return _new_range(meta, book, num, flags=self.flags)
 
     def MAJOR_LIST_SEP(self, token):
         # Major list separator means subsequent bare numbers are chapter numbers
         self.at_verse_level = False
         return MAJOR_LIST_SEP_SENTINEL
 
-    def MINOR_LIST_SEP(self, token):
-        return MINOR_LIST_SEP_SENTINEL
-
     def BOOK_NAME(self, token):
-        book = ref.BibleBook.from_str(str(token))
+        return self._book(str(token), token.start_pos, token.end_pos)
+
+    def _book(self, name: str, start_pos: int, end_pos: int) -> ref.BibleBook:
+        '''Returns the `BibleBook` for the book `name` found between `start_pos` and `end_pos`.'''
+        book = _book_name_cache.get(name)
         if book is None:
-            raise ref.BibleRefParsingError(f"{str(token)} is not a valid book name",
-                                       token.start_pos, token.end_pos)
+            book = ref.BibleBook.from_str(name)
+            if book is None:
+                raise ref.BibleRefParsingError(f"{name} is not a valid book name", start_pos, end_pos)
+            if len(_book_name_cache) >= _BOOK_NAME_CACHE_SIZE:
+                _book_name_cache.clear()
+            _book_name_cache[name] = book
         return book
 
     def NUM(self, token):
         return int(token)
 
+def _thread_scanner() -> _Scanner:
+    '''Returns the `_Scanner` (and with it, the `_BibleRefTransformer`) for the current thread, creating it if needed.'''
+    try:
+        return _thread_local.scanner
+    except AttributeError:
+        _thread_local.scanner = _Scanner(_BibleRefTransformer())
+        return _thread_local.scanner
+
+# Lark grammar for Bible references, with placeholders for the separators and the BOOK_NAME regex, which
+# depend on the Bible data. Formatted by _build_parser().
+_GRAMMAR_TEMPLATE = r'''
+    ?start: ref_list
+
+    ref_list: bible_ref (_list_sep bible_ref)* _list_sep?
+
+    ?bible_ref: (single_ref | dual_ref)
+
+    dual_ref: single_ref _RANGE_SEP single_ref
+
+    ?single_ref: book_only_ref
+            | book_num_ref
+            | book_chap_verse_ref
+            | chap_verse_ref
+            | num_only_ref
+
+    book_only_ref: BOOK_NAME
+    book_num_ref: BOOK_NAME NUM
+    book_chap_verse_ref: BOOK_NAME NUM _VERSE_SEP NUM
+    chap_verse_ref: NUM _VERSE_SEP NUM
+    num_only_ref: NUM
+
+    NUM: /[0-9]+/
+
+    // Terminals and rules beginning with an underscore are filtered out of the tree, so the
+    // transformer only sees the tokens it needs.
+    _RANGE_SEP: "{range_sep}"
+    _list_sep: MAJOR_LIST_SEP | _MINOR_LIST_SEP
+    MAJOR_LIST_SEP: "{major_list_sep}"
+    _MINOR_LIST_SEP: "{minor_list_sep}"
+    _VERSE_SEP: "{verse_sep_std}" | "{verse_sep_alt}"
+
+    BOOK_NAME: /{book_name_regex}/
+        // Books match as follows:
+        // Can start with any 'word' (\w) character (incl. numbers)
+        // Can include any amount of word characters or whitespace
+        // Cannot end with a digit, or any of these symbols -> : . ; , -
+
+    %import common.WS
+    %ignore WS
+'''
+
 def _recreate_parser():
-    global _parser_obj
-    range_sep = bible_data().range_sep
-    major_list_sep = bible_data().major_list_sep
-    minor_list_sep = bible_data().minor_list_sep
-    verse_sep_std = bible_data().verse_sep_std
-    verse_sep_alt = bible_data().verse_sep_alt
-    grammar = rf'''
-        ?start: ref_list
-
-        ref_list: bible_ref (list_sep bible_ref)* list_sep?
-
-        ?bible_ref: (single_ref | dual_ref)
-
-        dual_ref: single_ref RANGE_SEP single_ref
-
-        ?single_ref: book_only_ref
-                | book_num_ref
-                | book_chap_verse_ref
-                | chap_verse_ref
-                | num_only_ref
-
-        book_only_ref: BOOK_NAME
-        book_num_ref: BOOK_NAME NUM
-        book_chap_verse_ref: BOOK_NAME NUM VERSE_SEP NUM
-        chap_verse_ref: NUM VERSE_SEP NUM
-        num_only_ref: NUM
-
-        NUM: INT
-
-        RANGE_SEP: "{range_sep}"
-        ?list_sep: MAJOR_LIST_SEP | MINOR_LIST_SEP
-        MAJOR_LIST_SEP: "{major_list_sep}"
-        MINOR_LIST_SEP: "{minor_list_sep}"
-        VERSE_SEP: "{verse_sep_std}" | "{verse_sep_alt}"
-
-        BOOK_NAME: /\w(\w|\s)*[^0-9\s\{verse_sep_std}\{verse_sep_alt}\{major_list_sep}\{minor_list_sep}\{range_sep}]/  
-            // Books match as follows:
-            // Can start with any 'word' (\w) character (incl. numbers)
-            // Can include any amount of word characters or whitespace
-            // Cannot end with a digit, or any of these symbols -> : . ; , -
-
-        %import common.WS
-        %import common.INT
-        %ignore WS
+    global _parser_obj, _token_regex
+    _clear_parse_cache()
+    (_parser_obj, _token_regex) = _build_parser(bible_data().range_sep, bible_data().major_list_sep,
+                                                bible_data().minor_list_sep, bible_data().verse_sep_std,
+                                                bible_data().verse_sep_alt)
+
+def _lark_str(string) -> str:
+    '''Escapes `string` for use inside a double-quoted Lark string literal.'''
+    return string.replace('\\', '\\\\').replace('"', '\\"')
+
+
+@functools.lru_cache(maxsize=8)
+def _build_parser(range_sep, major_list_sep, minor_list_sep, verse_sep_std, verse_sep_alt) -> tuple:
+    '''Returns a tuple of (Lark parser, tokenizer regex) for the given separators.
+
+    The results are cached, so that switching back to a previous set of separators doesn't rebuild the parser.
     '''
-    _parser_obj = Lark(grammar, propagate_positions=True)
+    # Separators are escaped, so that any character can be used as a separator
+    seps_regex = ''.join(re.escape(sep) for sep in
+                         (verse_sep_std, verse_sep_alt, major_list_sep, minor_list_sep, range_sep))
+    book_name_regex = rf'\w(\w|\s)*[^0-9\s{seps_regex}]'
+    grammar = _GRAMMAR_TEMPLATE.format(range_sep=_lark_str(range_sep),
+                                       major_list_sep=_lark_str(major_list_sep),
+                                       minor_list_sep=_lark_str(minor_list_sep),
+                                       verse_sep_std=_lark_str(verse_sep_std),
+                                       verse_sep_alt=_lark_str(verse_sep_alt),
+                                       book_name_regex=book_name_regex.replace('/', '\\/'))
+    parser_obj = Lark(grammar, parser="lalr", lexer="contextual", cache=True, propagate_positions=True)
+
+    # Tokenizer for _Scanner. As in the Lark lexer, BOOK_NAME is tried before NUM, and whitespace
+    # (as defined by common.WS) is skipped.
+    token_regex = re.compile(rf'''[ \t\f\r\n]*(?:
+        (?P<BOOK_NAME>{book_name_regex})
+        |(?P<NUM>[0-9]+)
+        |(?P<VERSE_SEP>{re.escape(verse_sep_std)}|{re.escape(verse_sep_alt)})
+        |(?P<RANGE_SEP>{re.escape(range_sep)})
+        |(?P<MAJOR_LIST_SEP>{re.escape(major_list_sep)})
+        |(?P<MINOR_LIST_SEP>{re.escape(minor_list_sep)})
+        |$)''', re.VERBOSE)
+    return (parser_obj, token_regex)
+
+
+# We delay this import until this point so that _recreate_parser() is already defined when the data submodule
+# (loaded via ref) calls it, even if this submodule is the first to be imported.
+from bibleref import ref
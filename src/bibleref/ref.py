@@ -2,6 +2,7 @@
 # TODO: Create context manager to temporarily set or unset particular flags
 # TODO: Create module method to make it easier to keep existing flags but set/unset particular flags
 
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
 from enum import Enum, Flag, auto
 from typing import Union
@@ -38,6 +39,17 @@ class BibleFlag(Flag):
 bibleref.flags = BibleFlag.NONE # Default setting for global flags attribute.
 
 
+def _resolve_flags(flags: BibleFlag) -> BibleFlag:
+    '''Returns `flags`, or if no flags are given, the global `bibleref.flags`.'''
+    # Equivalent to `flags or bibleref.flags or BibleFlag.NONE`, but avoids the comparatively slow Flag.__bool__().
+    # (A Flag with no members set is always the NONE member.)
+    if flags is None or flags is BibleFlag.NONE:
+        flags = bibleref.flags
+        if flags is None:
+            return BibleFlag.NONE
+    return flags
+
+
 class BibleBook(Enum):
     '''An enum of books in the Bible.
 
@@ -51,10 +63,21 @@ class BibleBook(Enum):
     books' position in the book ordering.
     '''
     # Extra private attributes:
-    # _max_verses:  List of max verse number for each chapter (ascending by chapter).
-    #                 Len of list is number of chapters. None if no max_verse data supplied.
+    # _max_verses:  Sequence (a memoryview into a flat array) of max verse number for each chapter
+    #                 (ascending by chapter). Len is number of chapters. None if no max_verse data supplied.
+    # _chap_verse_offsets: List of the number of verses (excluding verse 0s) before each chapter, with a final
+    #                 entry for the whole book. Len is number of chapters + 1. None if no max_verse data supplied.
     # _verse_0s:    Set of chapter numbers (1-indexed) that can begin with a verse 0. Empty set
     #                 if no chapters can begin with a verse 0.
+    # _min_chap_num: Lowest chapter number (currently always 1, or 0 if no max_verse data supplied).
+    #                 Perhaps in future some books may have a chapter-0 prologue included?
+    # _max_chap_num: Highest chapter number (0 if no max_verse data supplied).
+    # _chap_count:  Number of chapters.
+    # _is_single_chap: True if the book has only one chapter (e.g. Obadiah, Jude).
+    # _next:        Next book in the book ordering. None if this is the final book, or not in the ordering.
+    # _prev:        Previous book in the book ordering. None if this is the first book, or not in the ordering.
+    # _edge_verses: Dictionary cache of the BibleVerses returned by first_verse() and last_verse(), keyed by
+    #                 (chap_num, verse_num). Cleared whenever the max_verse or verse 0 data changes.
     #
     Gen     = "Gen" 
     Exod    = "Exod"
@@ -132,13 +155,14 @@ class BibleBook(Enum):
         If no book matches and raise_error is True, an `InvalidReferenceError` is raised.
         '''
         string = string.strip()
-        match = False
-        for book in BibleBook:
-            if book.regex is not None and book.regex.fullmatch(string) is not None:
-                match = True
-                break
-        if match:
+        data = bible_data()
+        book = data._book_names.get(" ".join(string.split()).lower())
+        if book is not None:
             return book
+        # Fall back to the books' regexes (combined into one) for any names the lookup doesn't cover
+        match = data._book_regex.fullmatch(string) if data._book_regex is not None else None
+        if match is not None:
+            return BibleBook[match.lastgroup]
         else:
             if raise_error:
                 raise InvalidReferenceError(f"No book found for string '{string}'")
@@ -147,44 +171,51 @@ class BibleBook(Enum):
 
     def verse_count(self, flags: BibleFlag = None) -> int:
         '''Returns the number of verses in this `BibleBook`.'''
-        count = 0
-        for i in range(self.chap_count()):
-            count += (self.max_verse_num(i+1) - self.min_verse_num(i+1, flags=flags) + 1)
+        if self._chap_verse_offsets is None:
+            raise InvalidReferenceError(f"No chapter {self._min_chap_num + 1} in {self.title}")
+        count = self._chap_verse_offsets[-1]
+        if self._verse_0s and BibleFlag.VERSE_0 in _resolve_flags(flags):
+            count += len(self._verse_0s)
         return count
 
+    def _verse_index(self, chap_num: int, verse_num: int, flags: BibleFlag) -> int:
+        '''Returns the 0-based position of the given verse within this book, where verse 0s are only counted
+        if `BibleFlag.VERSE_0` is in `flags`.'''
+        index = self._chap_verse_offsets[chap_num - 1] + verse_num - 1
+        if self._verse_0s and BibleFlag.VERSE_0 in flags:
+            index += sum(1 for verse_0_chap in self._verse_0s if verse_0_chap <= chap_num)
+        return index
+
     def chap_count(self) -> int:
         '''Returns the number of chapters in this `BibleBook`.
         '''
-        return (self.max_chap_num() - self.min_chap_num() + 1)
+        return self._chap_count
 
     def min_chap_num(self) -> int:
         '''Return lowest chapter number (currently always 1) for this `BibleBook`.
         '''
-        if self._max_verses is None:
-            return 0
-        else:
-            return 1    # Currently always 1. Perhaps in future some books may have a chapter-0 prologue included?
+        return self._min_chap_num
 
     def max_chap_num(self) -> int:
         '''Return highest chapter number for this `BibleBook`.
         '''
-        if self._max_verses is None:
-            return 0
-        else:
-            return len(self._max_verses)
+        return self._max_chap_num
 
     def min_verse_num(self, chap_num: int, flags: BibleFlag = None) -> int:
         '''Return the lowest verse number (0 or 1) for the specified chapter number of this `BibleBook`.
         '''
-        flags = flags or bibleref.flags or BibleFlag.NONE
-        if chap_num < self.min_chap_num() or chap_num > self.max_chap_num():
+        if chap_num < self._min_chap_num or chap_num > self._max_chap_num:
             raise InvalidReferenceError(f"No chapter {chap_num} in {self.title}")
-        return 0 if (BibleFlag.VERSE_0 in flags and chap_num in self._verse_0s) else 1
+        # Check the (usually empty) set first, as testing flag membership is comparatively slow
+        if chap_num not in self._verse_0s:
+            return 1
+        flags = _resolve_flags(flags)
+        return 0 if BibleFlag.VERSE_0 in flags else 1
 
     def max_verse_num(self, chap_num: int) -> int:
         '''Return the highest verse number for the specified chapter number of this `BibleBook`.
         '''
-        if chap_num < self.min_chap_num() or chap_num > self.max_chap_num():
+        if chap_num < self._min_chap_num or chap_num > self._max_chap_num:
             raise InvalidReferenceError(f"No chapter {chap_num} in {self.title}")
         return self._max_verses[chap_num-1]
 
@@ -194,7 +225,13 @@ class BibleBook(Enum):
         '''
         if chap_num is None:
             chap_num = self.min_chap_num()
-        return BibleVerse(self, chap_num, self.min_verse_num(chap_num, flags))        
+        verse_num = self.min_verse_num(chap_num, flags)
+        try:
+            return self._edge_verses[(chap_num, verse_num)]
+        except KeyError:
+            verse = BibleVerse._unchecked(self, chap_num, verse_num)
+            self._edge_verses[(chap_num, verse_num)] = verse
+            return verse
 
     def last_verse(self, chap_num: int = None) -> 'BibleVerse':
         '''Returns a `BibleVerse` for the last verse of the specified chapter of this `BibleBook`.
@@ -202,25 +239,25 @@ class BibleBook(Enum):
         '''
         if chap_num is None:
             chap_num = self.max_chap_num()
-        return BibleVerse(self, chap_num, self.max_verse_num(chap_num))        
+        verse_num = self.max_verse_num(chap_num)
+        try:
+            return self._edge_verses[(chap_num, verse_num)]
+        except KeyError:
+            verse = BibleVerse._unchecked(self, chap_num, verse_num)
+            self._edge_verses[(chap_num, verse_num)] = verse
+            return verse
 
     def next(self) -> 'BibleBook':
         '''Returns the next `BibleBook` in the book ordering, or `None` if this is the final book,
         or is not part of the ordering.
         '''
-        if self.order is None or self.order == len(bible_data().book_order)-1:
-            return None
-        else:
-            return bible_data().book_order[self.order+1]
+        return self._next
 
     def prev(self) -> 'BibleBook':
         '''Returns the previous `BibleBook` in the book ordering, or `None` if this is the first book,
         or is not part of the ordering.
         '''
-        if self.order is None or self.order == 0:
-            return None
-        else:
-            return bible_data().book_order[self.order-1]
+        return self._prev
 
     def range(self, flags: BibleFlag = None) -> 'BibleRange':
         '''Returns a `BibleRange` spanning this entire `BibleBook`.
@@ -289,7 +326,7 @@ class BibleVersePart(Flag):
     CHAP_VERSE  = CHAP | VERSE
 
 
-@dataclass(init=False, repr=False, eq=True, order=True, frozen=True)
+@dataclass(init=False, repr=False, eq=False, order=False, frozen=True)
 class BibleVerse:
     '''A reference to a single Bible verse (e.g. Matt 2:3).
 
@@ -305,6 +342,19 @@ class BibleVerse:
     chap_num:   int
     verse_num:  int
 
+    # Slots save memory and speed up attribute access. (dataclass only supports slots=True from Python 3.10.)
+    __slots__ = ('book', 'chap_num', 'verse_num', '_packed', '_hash')
+
+    def __getstate__(self):
+        return (self.book, self.chap_num, self.verse_num)
+
+    def __setstate__(self, state):
+        # Needed for copy and pickle, which would otherwise try to set the slots on a frozen instance
+        object.__setattr__(self, "book", state[0])
+        object.__setattr__(self, "chap_num", state[1])
+        object.__setattr__(self, "verse_num", state[2])
+        object.__setattr__(self, "_packed", (state[1] << 16) | state[2])
+
     def __init__(self, *args, flags: BibleFlag = None):
         '''A `BibleVerse` can be constructed in any of the following ways:
 
@@ -321,12 +371,13 @@ class BibleVerse:
         '''
         if len(args) == 1:
             if isinstance(args[0], str):
-                range_list = BibleRangeList(args[0], flags=flags)
-                if len(range_list) != 1 or not range_list[0].is_single_verse():
+                # Read the parser's cached ranges directly, rather than copying them into a BibleRangeList
+                ranges = [bible_range for group in parser._parse_groups(args[0], flags) for bible_range in group]
+                if len(ranges) != 1 or not ranges[0].is_single_verse():
                     raise InvalidReferenceError(f"String is not a single verse: {args[0]}")
-                object.__setattr__(self, "book", range_list[0].start.book)
-                object.__setattr__(self, "chap_num", range_list[0].start.chap_num)
-                object.__setattr__(self, "verse_num", range_list[0].start.verse_num)
+                object.__setattr__(self, "book", ranges[0].start.book)
+                object.__setattr__(self, "chap_num", ranges[0].start.chap_num)
+                object.__setattr__(self, "verse_num", ranges[0].start.verse_num)
             elif isinstance(args[0], BibleVerse):
                 # We have to use object.__setattr__ because the class is frozen
                 object.__setattr__(self, "book", args[0].book)
@@ -350,19 +401,94 @@ class BibleVerse:
                 raise ValueError(f"{chap_num} is not an integer chapter number")
             if not isinstance(verse_num, int):
                 raise ValueError(f"{chap_num} is not an integer verse number")
-            if chap_num < book.min_chap_num() or chap_num > book.max_chap_num():
+            if chap_num < book._min_chap_num or chap_num > book._max_chap_num:
                 raise InvalidReferenceError(f"No chapter {chap_num} in {book.title}")
-            if verse_num < book.min_verse_num(chap_num, flags) or verse_num > book.max_verse_num(chap_num):
+            # The chapter is known to be valid, so we check the verse against the book data directly, rather
+            # than through min_verse_num() and max_verse_num(), which would check the chapter again.
+            if verse_num < 1:
+                if verse_num < 0 or chap_num not in book._verse_0s or \
+                   BibleFlag.VERSE_0 not in _resolve_flags(flags):
+                    raise InvalidReferenceError(f"No verse {verse_num} in {book.title} {chap_num}")
+            elif verse_num > book._max_verses[chap_num-1]:
                 raise InvalidReferenceError(f"No verse {verse_num} in {book.title} {chap_num}")
             object.__setattr__(self, "book", book) # We have to use object.__setattr__ because the class is frozen
             object.__setattr__(self, "chap_num", chap_num)
             object.__setattr__(self, "verse_num", verse_num)
+        # The chapter and verse packed into one int, so that verses in the same book compare with a single int
+        # comparison. The book order isn't packed in too, because it can change after the verse is created.
+        object.__setattr__(self, "_packed", (self.chap_num << 16) | self.verse_num)
+
+    @classmethod
+    def _unchecked(cls, book: BibleBook, chap_num: int, verse_num: int) -> 'BibleVerse':
+        '''Returns a new `BibleVerse` without validating the arguments. Only for use internally, by callers
+        that have already computed a valid verse.'''
+        verse = object.__new__(cls)
+        object.__setattr__(verse, "book", book)
+        object.__setattr__(verse, "chap_num", chap_num)
+        object.__setattr__(verse, "verse_num", verse_num)
+        object.__setattr__(verse, "_packed", (chap_num << 16) | verse_num)
+        return verse
+
+    # We write the comparison methods by hand, rather than have the dataclass generate them, so that
+    # books are compared by their order as plain ints, rather than through BibleBook's comparison methods,
+    # and chapters and verses are compared using _packed.
+
+    def __eq__(self, other):
+        if not isinstance(other, BibleVerse):
+            return NotImplemented
+        return self.book is other.book and self._packed == other._packed
+
+    def __hash__(self):
+        # Verses are immutable, so we compute the hash on first use and keep it. It isn't part of the
+        # pickled state, since string hashes (and so book hashes) differ between interpreter runs.
+        try:
+            return self._hash
+        except AttributeError:
+            result = hash((self.book, self._packed))
+            object.__setattr__(self, "_hash", result)
+            return result
+
+    def __lt__(self, other):
+        if not isinstance(other, BibleVerse):
+            return NotImplemented
+        self_order = self.book.order
+        other_order = other.book.order
+        if self_order != other_order:
+            return self_order < other_order
+        return self._packed < other._packed
+
+    def __le__(self, other):
+        if not isinstance(other, BibleVerse):
+            return NotImplemented
+        self_order = self.book.order
+        other_order = other.book.order
+        if self_order != other_order:
+            return self_order <= other_order
+        return self._packed <= other._packed
+
+    def __gt__(self, other):
+        if not isinstance(other, BibleVerse):
+            return NotImplemented
+        self_order = self.book.order
+        other_order = other.book.order
+        if self_order != other_order:
+            return self_order > other_order
+        return self._packed > other._packed
+
+    def __ge__(self, other):
+        if not isinstance(other, BibleVerse):
+            return NotImplemented
+        self_order = self.book.order
+        other_order = other.book.order
+        if self_order != other_order:
+            return self_order >= other_order
+        return self._packed >= other._packed
 
     def verse_0_to_1(self) -> 'BibleVerse':
         '''If the `verse_num` of this `BibleVerse` is 0, returns an identical BibleVerse except with `verse_num`
         set to 1. Otherwise, returns the original `BibleVerse`.'''
         if self.verse_num == 0:
-            return BibleVerse(self.book, self.chap_num, 1)
+            return BibleVerse._unchecked(self.book, self.chap_num, 1)
         else:
             return self
     
@@ -371,7 +497,7 @@ class BibleVerse:
         same chapter, returns an identical `BibleVerse` except with `verse_num` set to 0. Otherwise, returns the
         original `BibleVerse`. **Note**: The value of the global attribute `bibleref.ref.flags` is *ignored*.'''
         if self.verse_num == 1 and self.min_verse_num(self.chap_num, flags=BibleFlag.VERSE_0) == 0:
-            return BibleVerse(self.book, self.chap_num, 0, flags=BibleFlag.VERSE_0)
+            return BibleVerse._unchecked(self.book, self.chap_num, 0)
         else:
             return self
 
@@ -470,28 +596,46 @@ class BibleVerse:
         '''
         if not isinstance(num_verses, int):
             raise TypeError(f"Cannot add a {type(num_verses)} to a BibleVerse")
-        flags = flags or bibleref.flags or BibleFlag.NONE
+        flags = _resolve_flags(flags)
         book = self.book
         chap_num = self.chap_num
         if self.verse_num == 0:
             flags = flags | BibleFlag.VERSE_0 # Honour existing verse 0s
         verse_num = self.verse_num + num_verses
-        max_verse_num = book.max_verse_num(chap_num)
+        # The loop reads the book's private data directly, rather than through the bounds-checked methods
+        allow_verse_0 = BibleFlag.VERSE_0 in flags
+        max_verse_num = book._max_verses[chap_num - 1]
         while verse_num > max_verse_num:
+            if not allow_verse_0 or not book._verse_0s:
+                # With no verse 0s to allow for, the chapter can be found by a binary search of the verse offsets
+                offsets = book._chap_verse_offsets
+                verse_index = offsets[chap_num - 1] + verse_num - 1
+                if verse_index < offsets[-1]:
+                    chap_num = bisect_right(offsets, verse_index)
+                    verse_num = verse_index - offsets[chap_num - 1] + 1
+                    break
+                # Beyond the end of the book, so skip to its last chapter and move on to the next book below
+                chap_num = book._max_chap_num
+                verse_num = verse_index - offsets[chap_num - 1] + 1
+                max_verse_num = book._max_verses[chap_num - 1]
             chap_num += 1
-            if chap_num > book.max_chap_num():
+            if chap_num > book._max_chap_num:
                 if BibleFlag.MULTIBOOK not in flags:
                     return None
                 else:
-                    book = book.next()
+                    book = book._next
                     if book is None:
                         return None
-                    chap_num = book.min_chap_num()
+                    chap_num = book._min_chap_num
             
-            verse_num = verse_num - max_verse_num + book.min_verse_num(chap_num, flags) - 1 
-            max_verse_num = book.max_verse_num(chap_num)
+            min_verse_num = 0 if allow_verse_0 and chap_num in book._verse_0s else 1
+            verse_num = verse_num - max_verse_num + min_verse_num - 1 
+            max_verse_num = book._max_verses[chap_num - 1]
 
-        return BibleVerse(book, chap_num, verse_num, flags=flags)
+        if num_verses < 0:
+            # The loop only moves forwards, so the result still needs validating
+            return BibleVerse(book, chap_num, verse_num, flags=flags)
+        return BibleVerse._unchecked(book, chap_num, verse_num)
 
     def subtract(self, other: Union[int, 'BibleVerse'], flags: BibleFlag = None) -> Union[int, 'BibleVerse']:
         '''
@@ -507,29 +651,55 @@ class BibleVerse:
 
         Using the `-` operator is equivalent to calling `subtract()` with `flags = None`.
         '''
-        flags = flags or bibleref.flags or BibleFlag.NONE
+        flags = _resolve_flags(flags)
         if isinstance(other, int):
             book = self.book
             chap_num = self.chap_num
             if self.verse_num == 0:
                 flags = flags | BibleFlag.VERSE_0 # Honour existing verse 0s
             verse_num = self.verse_num - other
-            min_verse_num = book.min_verse_num(chap_num, flags)
+            # As in add(), the loop reads the book's private data directly
+            allow_verse_0 = BibleFlag.VERSE_0 in flags
+            min_verse_num = 0 if allow_verse_0 and chap_num in book._verse_0s else 1
             while verse_num < min_verse_num:
+                if not allow_verse_0 or not book._verse_0s:
+                    # With no verse 0s to allow for, the chapter can be found by a binary search of the verse offsets
+                    offsets = book._chap_verse_offsets
+                    verse_index = offsets[chap_num - 1] + verse_num - 1
+                    if verse_index >= 0:
+                        chap_num = bisect_right(offsets, verse_index)
+                        verse_num = verse_index - offsets[chap_num - 1] + 1
+                        break
+                    # Before the start of the book, so skip to its first chapter and move back a book below
+                    chap_num = book._min_chap_num
+                    verse_num = verse_index + 1
+                    min_verse_num = 1
                 chap_num -= 1
-                if chap_num < book.min_chap_num():
+                if chap_num < book._min_chap_num:
                     if BibleFlag.MULTIBOOK not in flags:
                         return None
                     else:
-                        book = book.prev()
+                        book = book._prev
                         if book is None:
                             return None
-                        chap_num = book.max_chap_num()
+                        chap_num = book._max_chap_num
                 
-                verse_num = verse_num + book.max_verse_num(chap_num) - min_verse_num + 1 
-                min_verse_num = book.min_verse_num(chap_num)
-            return BibleVerse(book, chap_num, verse_num, flags=flags)
+                verse_num = verse_num + book._max_verses[chap_num - 1] - min_verse_num + 1 
+                min_verse_num = 0 if allow_verse_0 and chap_num in book._verse_0s else 1
+            if other < 0:
+                # The loop only moves backwards, so the result still needs validating
+                return BibleVerse(book, chap_num, verse_num, flags=flags)
+            return BibleVerse._unchecked(book, chap_num, verse_num)
         elif isinstance(other, BibleVerse):
+            if self.book is other.book:
+                # Find the difference of the verses' positions in the book, rather than counting a range
+                # between them. As for the range, the global flags are used, and verse 0s are counted
+                # if either verse is a verse 0.
+                range_flags = _resolve_flags(None)
+                if self.verse_num == 0 or other.verse_num == 0:
+                    range_flags |= BibleFlag.VERSE_0
+                return self.book._verse_index(self.chap_num, self.verse_num, range_flags) - \
+                       other.book._verse_index(other.chap_num, other.verse_num, range_flags)
             bible_range = BibleRange(start=self, end=other) # Bible will swap start and end as necessary
             difference = bible_range.verse_count() - 1
             if self < other:
@@ -565,7 +735,7 @@ class BibleVerse:
         - `verse_parts` is a combination of `BibleVersePart` flags, controlling what combination of book,
           chapter & verse are displayed.
         '''
-        if self.book.chap_count() == 1:
+        if self.book._is_single_chap:
             verse_parts &= ~BibleVersePart.CHAP # Don't display chap
         
         if BibleVersePart.BOOK in verse_parts:
@@ -589,7 +759,7 @@ class BibleVerse:
             return result.strip()
 
 
-@dataclass(init=False, repr=False, eq=True, order=True, frozen=True)
+@dataclass(init=False, repr=False, eq=False, order=False, frozen=True)
 class BibleRange:
     '''A reference to a continuous range of Bible verses (e.g. Matt 2:3-4:5).
 
@@ -605,11 +775,29 @@ class BibleRange:
     start: BibleVerse
     end: BibleVerse
 
+    # See the comments on BibleVerse's slots and hash
+    __slots__ = ('start', 'end', '_hash')
+
+    def __hash__(self):
+        try:
+            return self._hash
+        except AttributeError:
+            result = hash((self.start, self.end))
+            object.__setattr__(self, "_hash", result)
+            return result
+
+    def __getstate__(self):
+        return (self.start, self.end)
+
+    def __setstate__(self, state):
+        object.__setattr__(self, "start", state[0])
+        object.__setattr__(self, "end", state[1])
+
     @classmethod
     def whole_bible(cls, flags: BibleFlag = None) -> 'BibleRange':
         '''Returns a `BibleRange` representing the whole Bible.
         '''
-        flags = flags or bibleref.flags or BibleFlag.NONE
+        flags = _resolve_flags(flags)
         # By definition, we need to allow multibook to encompass whole Bible
         flags |= BibleFlag.MULTIBOOK
         start_book = bible_data().book_order[0]
@@ -617,6 +805,41 @@ class BibleRange:
         return BibleRange(start=start_book.first_verse(flags=flags),
                           end=end_book.last_verse(), flags=flags)
 
+    def _sort_key(self) -> tuple:
+        '''Returns a tuple of ints that orders the same way as this `BibleRange`, using each book's
+        precomputed position in the book order. Tuples of ints compare much faster than BibleRanges.'''
+        start = self.start
+        end = self.end
+        return (start.book.order, start._packed, end.book.order, end._packed)
+
+    # As for BibleVerse, we write the comparison methods by hand, so that they can compare sort keys
+    # rather than going through BibleVerse's comparison methods.
+
+    def __eq__(self, other):
+        if not isinstance(other, BibleRange):
+            return NotImplemented
+        return self.start == other.start and self.end == other.end
+
+    def __lt__(self, other):
+        if not isinstance(other, BibleRange):
+            return NotImplemented
+        return self._sort_key() < other._sort_key()
+
+    def __le__(self, other):
+        if not isinstance(other, BibleRange):
+            return NotImplemented
+        return self._sort_key() <= other._sort_key()
+
+    def __gt__(self, other):
+        if not isinstance(other, BibleRange):
+            return NotImplemented
+        return self._sort_key() > other._sort_key()
+
+    def __ge__(self, other):
+        if not isinstance(other, BibleRange):
+            return NotImplemented
+        return self._sort_key() >= other._sort_key()
+
     # TODO: Consider allowing a book and verse, without a chapter. Assume first or last chapter as necessary.
     def __init__(self, *args, start: BibleVerse = None, end: BibleVerse = None,
                  flags: BibleFlag = None):
@@ -661,7 +884,7 @@ class BibleRange:
         or using the `flags` argument, a `MultibookRangeNotAllowedError` is raised. If the arguments are of an
         incorrect number or type, a `ValueError` is raised.     
         '''
-        flags = flags or bibleref.flags or BibleFlag.NONE
+        flags = _resolve_flags(flags)
         if len(args) == 0:
             if BibleFlag.MULTIBOOK not in flags and start.book != end.book:
                 raise MultibookRangeNotAllowedError(f"Multi-book ranges not allowed " + 
@@ -675,11 +898,12 @@ class BibleRange:
             raise ValueError("Too many arguments supplied to BibleRange")
         if len(args) == 1:
             if isinstance(args[0], str):
-                range_list = BibleRangeList(args[0], flags=flags)
-                if len(range_list) != 1:
+                # As for BibleVerse, read the parser's cached ranges directly
+                ranges = [bible_range for group in parser._parse_groups(args[0], flags) for bible_range in group]
+                if len(ranges) != 1:
                     raise InvalidReferenceError(f"String is not a single verse range: {args[0]}")
-                object.__setattr__(self, "start", range_list[0].start)
-                object.__setattr__(self, "end", range_list[0].end)
+                object.__setattr__(self, "start", ranges[0].start)
+                object.__setattr__(self, "end", ranges[0].end)
                 return                
             elif isinstance(args[0], BibleRange):
                 object.__setattr__(self, "start", args[0].start)
@@ -814,13 +1038,31 @@ class BibleRange:
         return  (self.end == self.end.book.last_verse()) and \
                 (self.start <= self.end.book.first_verse(None, flags))
 
+    def _count_flags(self) -> BibleFlag:
+        '''Returns the flags used when counting the verses, chapters and books in this range. These are the
+        global flags, as used by split(), with `BibleFlag.VERSE_0` set if either end of the range is a verse 0.'''
+        flags = _resolve_flags(None)
+        if self.start.verse_num == 0 or self.end.verse_num == 0:
+            flags |= BibleFlag.VERSE_0
+        return flags
+
     def verse_count(self, flags: BibleFlag = None):
         '''Returns the number of verses in this range.'''
-        # We split the range into chapters, which is not the most efficient approach, but makes the counting simple.
-        bible_ranges = self.split(by_chap=True) # Each range will thus be within its own chapter
-        count = 0
-        for bible_range in bible_ranges:
-            count += (bible_range.end.verse_num - bible_range.start.verse_num + 1)
+        # We count from the positions of the start and end verses within their books, and the lengths of any
+        # books in between, rather than splitting the range into chapters. The result is the same as summing
+        # the verses in each range from split(by_chap=True).
+        count_flags = self._count_flags()
+        start = self.start
+        end = self.end
+        start_index = start.book._verse_index(start.chap_num, start.verse_num, count_flags)
+        end_index = end.book._verse_index(end.chap_num, end.verse_num, count_flags)
+        if start.book is end.book:
+            return end_index - start_index + 1
+        count = start.book.verse_count(count_flags) - start_index + end_index + 1
+        book = start.book._next
+        while book is not end.book:
+            count += book.verse_count(count_flags)
+            book = book._next
         return count
 
     def chap_count(self, whole: bool = False, flags: BibleFlag = None):
@@ -828,28 +1070,51 @@ class BibleRange:
         
         If `whole` is True, only whole chapters are counted. Otherwise partial chapters are also included in the
         count.'''
-        # We split the range into chapters, which is not the most efficient approach, but makes the counting simple.
-        bible_ranges = self.split(by_chap=True)
-        count = len(bible_ranges)
+        # As for verse_count(), we count without splitting the range. Only the first and last chapters
+        # can be partial.
+        start = self.start
+        end = self.end
+        if start.book is end.book:
+            chap_total = end.chap_num - start.chap_num + 1
+        else:
+            chap_total = start.book._max_chap_num - start.chap_num + 1
+            book = start.book._next
+            while book is not end.book:
+                chap_total += book._chap_count
+                book = book._next
+            chap_total += end.chap_num - end.book._min_chap_num + 1
+        count = chap_total
         if whole:
-            if not bible_ranges[0].is_whole_chap():
-                count -= 1
-            if len(bible_ranges) > 1 and not bible_ranges[-1].is_whole_chap():
+            if not self.spans_start_chap():
                 count -= 1
+            if chap_total > 1:
+                count_flags = self._count_flags()
+                end_chap = BibleRange(start=end.first_verse(flags=count_flags), end=end, flags=count_flags)
+                if not end_chap.is_whole_chap():
+                    count -= 1
         return count
 
     def book_count(self, whole: bool = False, flags: BibleFlag = None):
         '''Returns the number of Bible books in this range.
         
         If `whole` is True, only whole books are counted. Otherwise, partial books are also included in the count.'''
-        # We split the range into books, which is not the most efficient approach, but makes the counting simple.
-        bible_ranges = self.split(by_book=True)
-        count = len(bible_ranges)
+        # As for chap_count(), we count without splitting the range
+        start = self.start
+        end = self.end
+        book_total = 1
+        book = start.book
+        while book is not end.book:
+            book_total += 1
+            book = book._next
+        count = book_total
         if whole:
-            if not bible_ranges[0].is_whole_book():
-                count -= 1
-            if len(bible_ranges) > 1 and not bible_ranges[-1].is_whole_book():
+            if not self.spans_start_book():
                 count -= 1
+            if book_total > 1:
+                count_flags = self._count_flags()
+                end_book = BibleRange(start=end.book.first_verse(flags=count_flags), end=end, flags=count_flags)
+                if not end_book.is_whole_book():
+                    count -= 1
         return count
 
     def chap_range(self, flags: BibleFlag = None) -> 'BibleRange':
@@ -857,7 +1122,7 @@ class BibleRange:
         
         BibleFlag.MULTIBOOK is always set for this method, regardless of the value of `flags`.
         '''
-        flags = flags or bibleref.flags or BibleFlag.NONE
+        flags = _resolve_flags(flags)
         flags |= BibleFlag.MULTIBOOK
         return BibleRange(start=self.start.first_verse(flags=flags), end=self.end.last_verse(), flags=flags)
 
@@ -866,7 +1131,7 @@ class BibleRange:
         
         BibleFlag.MULTIBOOK is always set for this method, regardless of the value of `flags`.
         '''
-        flags = flags or bibleref.flags or BibleFlag.NONE
+        flags = _resolve_flags(flags)
         flags |= BibleFlag.MULTIBOOK
         return BibleRange(start=self.start.book.first_verse(flags=flags), end=self.end.book.last_verse(), flags=flags)
 
@@ -881,7 +1146,7 @@ class BibleRange:
           `BibleRangeList` will contain this range only.
         - If `regroup` is `True`, regroup() is called on the resulting `BibleRangeList`.
         '''
-        flags = flags or bibleref.flags or BibleFlag.NONE
+        flags = _resolve_flags(flags)
         # Set flags if our attributes imply they should be set
         if self.start.book != self.end.book:
             flags |= BibleFlag.MULTIBOOK
@@ -940,8 +1205,7 @@ class BibleRange:
             # Convert to BibleRange (and we don't enforce existing flags for conversions)
             other_ref = BibleRange(start=other_ref, end=other_ref, flags=BibleFlag.ALL)
         if isinstance(other_ref, BibleRange):
-            lower, higher = (self, other_ref) if self < other_ref else (other_ref, self)
-            return lower.end < higher.start
+            return self.end < other_ref.start or other_ref.end < self.start
         else:
             raise ValueError(f"{other_ref} is not a valid BibleRef")
 
@@ -978,8 +1242,8 @@ class BibleRange:
             # Convert to BibleRange (and we don't enforce existing flags for conversions)
             other_ref = BibleRange(start=other_ref, end=other_ref, flags=BibleFlag.ALL)
         if isinstance(other_ref, BibleRange):
-            return (other_ref.start >= self.start and other_ref.start <= self.end) and \
-                   (other_ref.end >= self.start and other_ref.end <= self.end)
+            # A range's start is never after its end, so only the outer bounds need comparing
+            return other_ref.start >= self.start and other_ref.end <= self.end
         else:
             raise ValueError(f"{other_ref} is not a valid BibleRef")
 
@@ -1102,10 +1366,27 @@ class BibleRange:
             return union[0].difference(intersection[0])
 
     def __iter__(self):
+        # Equivalent to repeatedly calling `verse.add(1, BibleFlag.MULTIBOOK)`, but walks the book data directly.
+        # As for add(), only the start verse can be a verse 0.
+        end = self.end
         verse = self.start
-        while verse is not None and verse <= self.end:
+        book = verse.book
+        chap_num = verse.chap_num
+        verse_num = verse.verse_num
+        max_verse_num = book._max_verses[chap_num - 1]
+        while verse <= end:
             yield verse
-            verse = verse.add(1, BibleFlag.MULTIBOOK) # `verse`` will be None if we're on the last verse of the Bible
+            verse_num += 1
+            if verse_num > max_verse_num:
+                chap_num += 1
+                if chap_num > book._max_chap_num:
+                    book = book._next
+                    if book is None:
+                        return # We were on the last verse of the Bible
+                    chap_num = book._min_chap_num
+                verse_num = 1
+                max_verse_num = book._max_verses[chap_num - 1]
+            verse = BibleVerse._unchecked(book, chap_num, verse_num)
 
     def __contains__(self, bible_ref) -> bool:
         '''Returns True if item is a BibleRef that falls within this range, otherwise False.
@@ -1229,14 +1510,12 @@ class BibleRangeList(util.GroupedList):
             
         3. As a copy of an existing BibleRangeList: `BibleRangeList(existing_bible_range_list)`
         '''
-        flags = flags or bibleref.flags or BibleFlag.NONE
+        flags = _resolve_flags(flags)
 
         if len(args) == 1:
             if isinstance(args[0], str):
-                range_groups_list = parser._parse(args[0], flags)
-                super().__init__()
-                for group in range_groups_list:
-                    self.append_group(group)
+                # Each group is a tuple, so is added as a separate group
+                super().__init__(parser._parse_groups(args[0], flags))
             elif isinstance(args[0], BibleRangeList):
                 super().__init__()
                 for group in args[0].groups:
@@ -1316,7 +1595,7 @@ class BibleRangeList(util.GroupedList):
         
         BibleFlag.MULTIBOOK is always set for this method, regardless of the value of `flags`.
         '''
-        flags = flags or bibleref.flags or BibleFlag.NONE
+        flags = _resolve_flags(flags)
         flags |= BibleFlag.MULTIBOOK
         min_range: BibleRange = min(self)
         max_range: BibleRange = max(self)
@@ -1329,7 +1608,7 @@ class BibleRangeList(util.GroupedList):
         
         BibleFlag.MULTIBOOK is always set for this method, regardless of the value of `flags`.
         '''
-        flags = flags or bibleref.flags or BibleFlag.NONE
+        flags = _resolve_flags(flags)
         flags |= BibleFlag.MULTIBOOK
         min_range: BibleRange = min(self)
         max_range: BibleRange = max(self)
@@ -1339,7 +1618,7 @@ class BibleRangeList(util.GroupedList):
     def sort(self, regroup: bool = True):
         '''Sorts this list in-place. All existing groups are cleared and replaced with a single
         new group. Then regroups if `regroup` is True.'''
-        super().sort()
+        super().sort(key=BibleRange._sort_key)
         if regroup:
             self.regroup()
 
@@ -1348,18 +1627,37 @@ class BibleRangeList(util.GroupedList):
         list of disjoint, non-adjacent `BibleRange` elements spanning the same verses as in the original
         list.
         '''
+        flags = _resolve_flags(flags)
         self.sort(regroup=False)
-        node = self._first
-        while node is not None and node.next is not None:
-            union = node.value.union(node.next.value, flags=flags)
-            if len(union) == 1: # Can merge these two ranges with their union
-                node.value = union[0]
-                self._pop_after(node)
-                # We don't move on yet, so we can compare the newly merged range
-                # with the (new) next node
-            else:
-                # The two ranges can't be merged, so move on
-                node = node.next
+        # Sweep through the sorted ranges, extending the current run of ranges for as long as each next range
+        # overlaps or is adjacent to it. This gives the same result as taking the union of each neighbouring pair,
+        # without creating a BibleRangeList for every union.
+        merged_ranges = []
+        run_range = None
+        for bible_range in self:
+            if run_range is not None:
+                start = bible_range.start
+                if not run_end < start or \
+                   (run_end.book is start.book and run_end.chap_num == start.chap_num and \
+                    run_end.verse_num + 1 == start.verse_num) or \
+                   run_end.add(1, flags=flags) == start:
+                    if bible_range.end > run_end:
+                        run_end = bible_range.end
+                    if run_end.book is not run_range.start.book and BibleFlag.MULTIBOOK not in flags:
+                        # Raise the MultibookRangeNotAllowedError as soon as the run spans two books
+                        BibleRange(start=run_range.start, end=run_end, flags=flags)
+                    run_is_merged = True
+                    continue
+                merged_ranges.append(BibleRange(start=run_range.start, end=run_end, flags=flags)
+                                     if run_is_merged else run_range)
+            run_range = bible_range
+            run_end = bible_range.end
+            run_is_merged = False
+        if run_range is not None:
+            merged_ranges.append(BibleRange(start=run_range.start, end=run_end, flags=flags)
+                                 if run_is_merged else run_range)
+        self.clear()
+        self.extend(merged_ranges)
         self.regroup()
 
     def is_disjoint(self, other_ref: 'BibleRef') -> bool:
@@ -1434,12 +1732,43 @@ class BibleRangeList(util.GroupedList):
         #   (A0 ∪ A1) ∩ (B0 ∪ B1) = (A0 ∩ B0) ∪ (A0 ∩ B1) ∪ (A1 ∩ B0) ∪ (A1 ∩ B1)
         # So the intersection of two BibleRefLists is a new list of the intersection of each item
         # combination.
+        #
+        # Rather than test every combination, we sort the larger list by start verse and binary search it
+        # for the ranges that can overlap each range in the smaller list. A range in the larger list can
+        # only overlap if its start is no later than the smaller range's end, and its end is no earlier
+        # than the smaller range's start. Since the larger list's ranges may themselves overlap, we search
+        # the running maximum of their ends, which (unlike the ends themselves) is sorted.
+        if len(self) <= len(other_ref):
+            probe_ranges, sorted_ranges = self, sorted(other_ref, key=BibleRange._sort_key)
+        else:
+            probe_ranges, sorted_ranges = other_ref, sorted(self, key=BibleRange._sort_key)
+        starts = [sorted_range.start for sorted_range in sorted_ranges]
+        max_ends = []
+        max_end = None
+        for sorted_range in sorted_ranges:
+            if max_end is None or sorted_range.end > max_end:
+                max_end = sorted_range.end
+            max_ends.append(max_end)
+
+        intersection_ranges = []
+        try:
+            for probe_range in probe_ranges:
+                probe_start = probe_range.start
+                probe_end = probe_range.end
+                for index in range(bisect_left(max_ends, probe_start), bisect_right(starts, probe_end)):
+                    sorted_range = sorted_ranges[index]
+                    if sorted_range.end >= probe_start:
+                        intersection_ranges.append(BibleRange(start=max(probe_start, sorted_range.start),
+                                                              end=min(probe_end, sorted_range.end), flags=flags))
+        except MultibookRangeNotAllowedError:
+            # The ranges above are visited in a different order to the item combinations, so intersect the
+            # combinations in order to raise the error for the first one that spans books.
+            for self_range in self:
+                for other_range in other_ref:
+                    self_range.intersection(other_range, flags=flags)
+            raise
         new_list = BibleRangeList()
-        for self_range in self:
-            for other_range in other_ref:
-                item_intersection_list = self_range.intersection(other_range, flags=flags)
-                if len(item_intersection_list) > 0:
-                    new_list.append(item_intersection_list[0])
+        new_list.extend(intersection_ranges) # Links the new nodes in a single pass
         new_list.merge(flags=flags)
         return new_list
 
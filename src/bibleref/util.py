@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from collections.abc import MutableSequence, Iterable
 
 from bibleref import BibleRefException
@@ -7,7 +9,7 @@ from bibleref import BibleRefException
 # This linked list is derived from the implementation in the python-ranges module
 # at https://github.com/Superbird11/ranges, under the MIT Licence
 #
-class GroupedList(MutableSequence):
+class GroupedList:
     '''A linked-list, with the ability to also group items.
     
     A group is a view of a subset of the list. By default, all items are placed in one
@@ -32,16 +34,20 @@ class GroupedList(MutableSequence):
         '''Nodes of the linked list.
         
         Groups are defined by setting node.is_group_head to True for the first node
-        of the group. The group continues until the next group head.
+        of the group. The group continues until the next group head. Group heads are
+        also linked to each other, so that groups can be added and removed in O(1) time.
         '''
+        __slots__ = ('value', 'parent', 'prev', 'next', 'is_group_head', 'prev_head', 'next_head')
+        __hash__ = None # Nodes compare by value, so aren't hashable. They're looked up by identity instead.
+
         def __init__(self, value, prev=None, next=None, parent=None):
             self.value = value
             self.parent: 'GroupedList' = parent
             self.prev: 'GroupedList._Node' = prev
             self.next: 'GroupedList._Node' = next
             self.is_group_head: bool = False  # True if this node is the start of a group.
-            self.prev_head: 'GroupedList._Node' = None # If this is a group head, link to next group head.
-            self.next_head: 'GroupedList._Node' = None # If this is a group head, link to prev group head.
+            self.prev_head: 'GroupedList._Node' = None # If this is a group head, link to prev group head.
+            self.next_head: 'GroupedList._Node' = None # If this is a group head, link to next group head.
 
         def clear_group_head(self):
             self.is_group_head = False
@@ -63,14 +69,11 @@ class GroupedList(MutableSequence):
         def __le__(self, other):
             return self.value.__le__(other.value)
 
-        def _id(self, obj):
-            return id(obj) if obj is not None else None
-
         def __repr__(self):
             return str(self)
 
         def __str__(self):
-            group = f" G {self._id(self.prev_head)} {id(self)} {self._id(self.next_head)}" if self.is_group_head else ""
+            group = f" G {id(self)}" if self.is_group_head else ""
             return f"Node({str(self.value)}{group})"
 
     class GroupViews:
@@ -80,6 +83,8 @@ class GroupedList(MutableSequence):
         gives the collection length. The collection can be indexed to return a particular
         `GroupView`: e.g. `group_views[2]`
         '''
+        __slots__ = ('parent',)
+
         def __init__(self, parent: 'GroupedList'):
             self.parent = parent
 
@@ -87,28 +92,27 @@ class GroupedList(MutableSequence):
             ''' Check the group index is within range. If negative, convert to its
             positive equivalent. Return the resulting index.
             '''
-            if group_index < 0:
-                group_index += self.parent._group_count
-            if group_index >= self.parent._group_count:
+            group_count = self.parent._group_count
+            conformed_index = group_index + group_count if group_index < 0 else group_index
+            if not 0 <= conformed_index < group_count:
                 raise IndexError(f"Group index {group_index} out of range")
-            return group_index
+            return conformed_index
 
         def _group_at(self, group_index: int) -> 'GroupedList._Node':
             group_index = self._conform_group_index(group_index)
-            group_head = self.parent._first_head
-            for i in range(group_index):
-                group_head = group_head.next_head
-            return group_head
+            return self.parent._group_heads[group_index]
 
         def __len__(self):
             return self.parent._group_count
 
         def __iter__(self):
             '''Yields a `GroupedList.GroupView` for each group in the list.'''
-            group_head = self.parent._first_head
-            while group_head is not None:
-                yield GroupedList.GroupView(group_head)
-                group_head = group_head.next_head
+            # Iterate over a snapshot, so that groups can be added or removed during iteration.
+            # Heads that have since stopped being group heads of this list are skipped.
+            parent = self.parent
+            for group_head in tuple(parent._group_heads):
+                if group_head.is_group_head and group_head.parent is parent:
+                    yield GroupedList.GroupView(group_head)
 
         def __getitem__(self, group_index):
             group_head = self._group_at(group_index)
@@ -132,6 +136,8 @@ class GroupedList(MutableSequence):
 
         `del group_view[2]`
         '''
+        __slots__ = ('group_head',)
+
         def __init__(self, group_head: 'GroupedList._Node'):
             self.group_head = group_head
 
@@ -150,9 +156,10 @@ class GroupedList(MutableSequence):
             self._check_group_head()
             node = self.group_head
             yield node.value
-            while node.next is not None and not node.next.is_group_head:
-                node = node.next
+            node = node.next
+            while node is not None and not node.is_group_head:
                 yield node.value
+                node = node.next
 
         def _node_at(self, index) -> 'GroupedList._Node':
             if index < 0:
@@ -190,14 +197,21 @@ class GroupedList(MutableSequence):
         
         If the items of `iterable` are Python lists or tuples, each element of `iterable` is added as a
         separate group.'''
-        self.clear()
+        self._reset()
         if iterable is None:
             return
+        # Consecutive plain items are gathered up so they can be appended in one batch
+        pending_items = []
         for item in iterable:
             if isinstance(item, list) or isinstance(item, tuple):
+                if pending_items:
+                    self.extend(pending_items)
+                    pending_items = []
                 self.append_group(item)
             else:
-                self.append(item)
+                pending_items.append(item)
+        if pending_items:
+            self.extend(pending_items)
 
     def _check_type(self, value):
         '''Subclasses can override to raise an exception if the provided
@@ -213,26 +227,28 @@ class GroupedList(MutableSequence):
         ''' Check the index is within range. If negative, convert to its
         positive equivalent. Return the resulting index.
         '''
-        if index < 0:
-            index += self._node_count
-        if index >= self._node_count:
+        count = self._node_count
+        conformed_index = index + count if index < 0 else index
+        if not 0 <= conformed_index < count:
             raise IndexError(f"List index {index} out of range")
-        return index
+        return conformed_index
 
     def _node_at(self, index: int) -> 'GroupedList._Node':
         index = self._conform_index(index)
-        if index <= self._node_count // 2:
-            # Node is closer to the start, so search from there
-            node = self._first
-            for i in range(index):
-                node = node.next
-            return node
-        else:
-            # Node is closer to the end, so seach from there
-            node = self._last
-            for i in range(self._node_count - index - 1):
-                node = node.prev
-            return node
+        # Walk from whichever is closest: the start, the end, or the node most recently found by this method
+        (node, node_index) = (self._first, 0)
+        if self._node_count - 1 - index < index:
+            (node, node_index) = (self._last, self._node_count - 1)
+        if self._finger is not None and abs(self._finger[0] - index) < abs(node_index - index):
+            (node_index, node) = self._finger
+        while node_index < index:
+            node = node.next
+            node_index += 1
+        while node_index > index:
+            node = node.prev
+            node_index -= 1
+        self._finger = (index, node)
+        return node
 
     def _insert_first(self, value):
         '''Inserts `value` as the first item of the list.'''
@@ -253,10 +269,12 @@ class GroupedList(MutableSequence):
             self._first_head = self._first
             self._last_head = self._first
             self._group_count = 1
+            self._group_heads_cache = None
 
     def _insert_before(self, node: 'GroupedList._Node', value, new_group: bool = False):
         '''Inserts `value` in the list before `node`.'''
         self._check_is_child(node)
+        self._finger = None # Indexes from here on have shifted
         inserting_first = True if node is self._first else None
         new = self._Node(value, prev=node.prev, next=node, parent=self)
         if node.prev is not None:
@@ -284,6 +302,8 @@ class GroupedList(MutableSequence):
     def _insert_after(self, node: 'GroupedList._Node', value, new_group: bool = False):
         '''Inserts `value` in the list after `node`.'''
         self._check_is_child(node)
+        if node is not self._last:
+            self._finger = None # Indexes after here have shifted
         inserting_last = True if node is self._last else None
         new = self._Node(value, prev=node, next=node.next, parent=self)
         if node.next is not None:
@@ -316,10 +336,11 @@ class GroupedList(MutableSequence):
             old_head.clear_group_head()
         if self._first_head is old_head:
             self._first_head = node
+        self._group_heads_cache = None
 
     def _insert_new_group_at_node(self, node: 'GroupedList._Node'):
-        if node is self._first:
-            # First node is always already a group.
+        if node.is_group_head:
+            # Node already starts a group. (The first node always does.)
             return
         node.is_group_head = True
         prev_group_head = self._find_group_head(node.prev)
@@ -331,6 +352,22 @@ class GroupedList(MutableSequence):
         if self._last_head is prev_group_head:
             self._last_head = node
         self._group_count += 1
+        self._group_heads_cache = None
+
+    @property
+    def _group_heads(self) -> list:
+        '''The group heads of this list, in order.
+        
+        The list is rebuilt from the group head links the first time it's needed after the groups change,
+        so that it can be indexed in O(1) time. Don't modify it.'''
+        if self._group_heads_cache is None:
+            group_heads = []
+            group_head = self._first_head
+            while group_head is not None:
+                group_heads.append(group_head)
+                group_head = group_head.next_head
+            self._group_heads_cache = group_heads
+        return self._group_heads_cache
 
     def _find_group_head(self, node: 'GroupedList._Node') -> 'GroupedList._Node':
         '''Search for the next group head, beginning at `node`, and returning the group head node.'''
@@ -341,44 +378,37 @@ class GroupedList(MutableSequence):
     def _pop_node(self, node: 'GroupedList._Node'):
         '''Remove `node` from this list, and returns the node's value.'''
         self._check_is_child(node)
-        if self._node_count == 1:
-            # pop only element
-            self._first = None
-            self._last = None
-            self._first_head = None
-            self._last_head = None
-        elif node is self._first:
-            # pop from start
-            self._first = node.next
-            self._first.prev = None
-        elif node is self._last:
-            # pop at end
-            self._last = self._last.prev
-            self._last.next = None
+        self._finger = None
+        # Unlink the node. A missing neighbour means the node is at that end of the list.
+        prev = node.prev
+        next = node.next
+        if prev is None:
+            self._first = next
         else:
-            # pop from somewhere in middle
-            node.prev.next = node.next
-            node.next.prev = node.prev
+            prev.next = next
+        if next is None:
+            self._last = prev
+        else:
+            next.prev = prev
         
         node.parent = None
         self._node_count -= 1
 
         if node.is_group_head:
             # Try pushing the group head forward one node
-            if node.next is None or node.next.is_group_head:
+            if next is None or next.is_group_head:
                 # The next node either doesn't exist or is already the start of another group.
                 # Either way we're losing the group this node belongs to.
-                self._group_count -= 1
                 next_head_link = node.next_head
                 prev_head_link = node.prev_head
+                self._group_count -= 1
             else:
                 # We can successfully push the group head forward to the next node
-                node.next.is_group_head = True
-                node.next.prev_head = node.prev_head
-                node.next.next_head = node.next_head
-                next_head_link = node.next
-                prev_head_link = node.next
-
+                next.is_group_head = True
+                next.prev_head = node.prev_head
+                next.next_head = node.next_head
+                next_head_link = next
+                prev_head_link = next
             if self._first_head is node:
                 self._first_head = next_head_link
             if self._last_head is node:
@@ -388,6 +418,7 @@ class GroupedList(MutableSequence):
             if node.next_head is not None:
                 node.next_head.prev_head = prev_head_link
             node.clear_group_head()
+            self._group_heads_cache = None
 
         return node.value
 
@@ -420,12 +451,16 @@ class GroupedList(MutableSequence):
     def to_nested_lists(self):
         '''Returns this `GroupedList` represented as a regular Python list of groups, which are in turn a regular
         list of the group's values.'''
+        # Walk the nodes once, starting a new inner list at each group head
         outer_list = []
-        for group in self.groups:
-            inner_list = []
-            for item in group:
-                inner_list.append(item)
-            outer_list.append(inner_list)
+        inner_list = None
+        node = self._first
+        while node is not None:
+            if node.is_group_head:
+                inner_list = []
+                outer_list.append(inner_list)
+            inner_list.append(node.value)
+            node = node.next
         return outer_list
 
     def index(self, value, min_index: int = None, limit_index: int =None):
@@ -481,36 +516,74 @@ class GroupedList(MutableSequence):
         '''Appends each item of `iterable` to the end of this list.
         
         The new items all form a single new group.'''
-        is_first_item = True
-        for item in iterable:
-            self.append(item, new_group=is_first_item)
-            is_first_item = False
+        self._append_chain(iterable, new_group=True)
 
     def extend(self, iterable):
         '''Appends each item of `iterable` to the end of this list.'''
-        for item in iterable:
-            self.append(item)
+        self._append_chain(iterable, new_group=False)
+
+    def _append_chain(self, iterable, new_group: bool):
+        '''Appends each item of `iterable` to the end of this list. If `new_group` is true, the
+        new items form a new group.'''
+        # Build the new items as a detached chain, then splice it onto the end of the list in one step.
+        # If an item fails the type check, the list is left unchanged.
+        check_type = self._check_type
+        Node = self._Node
+        chain_first = None
+        chain_last = None
+        chain_count = 0
+        for value in iterable:
+            check_type(value)
+            node = Node(value, prev=chain_last, parent=self)
+            if chain_last is None:
+                chain_first = node
+            else:
+                chain_last.next = node
+            chain_last = node
+            chain_count += 1
+        if chain_count == 0:
+            return
+
+        if self._node_count == 0:
+            self._first = chain_first
+            self._last = chain_last
+            self._node_count = chain_count
+            self._setup_single_group()
+        else:
+            chain_first.prev = self._last
+            self._last.next = chain_first
+            self._last = chain_last
+            self._node_count += chain_count
+            if new_group:
+                chain_first.is_group_head = True
+                chain_first.prev_head = self._last_head
+                self._last_head.next_head = chain_first
+                self._last_head = chain_first
+                self._group_count += 1
+                self._group_heads_cache = None
 
     def insert(self, index: int, value):
         '''Inserts `value` into this list at the given `index`.'''
-        self._check_type(value)
+        # prepend() and append() check the value's type themselves
         if index == 0:
             self.prepend(value)
         elif index == self._node_count:
             self.append(value)
         else:
-            self._insert_before(self._node_at(index), value)
+            self._check_type(value)
+            node = self._node_at(index)
+            self._insert_before(node, value)
+            # The node found has only shifted along by one, so keep it as the finger for nearby inserts
+            self._finger = (index + 1, node)
 
     def insert_group_at(self, index: int = None):
-        index = self._conform_index(index)
         self._insert_new_group_at_node(self._node_at(index))
 
     def pop(self, index: int = None):
         '''Removes the item at the given `index`, and returns its value.'''
         if index is None:
             index = self._node_count - 1
-        index = self._conform_index(index)
-        return self._pop_node(self._node_at(index))
+        return self._pop_node(self._node_at(index)) # _node_at() checks and conforms the index
 
     def remove(self, value):
         '''Removes the first occurence of the given `value` from this list.'''
@@ -526,18 +599,42 @@ class GroupedList(MutableSequence):
 
     def clear(self):
         '''Removes all items from the list.'''
+        # Detach every node, so that any existing GroupViews become invalid. The nodes keep their links,
+        # so that any iterator paused on one of them can still finish.
+        node = self._first
+        while node is not None:
+            node.parent = None
+            node.clear_group_head()
+            node = node.next
+        self._reset()
+
+    def _reset(self):
+        '''Sets the list to be empty, without touching any existing nodes.'''
         self._first: GroupedList._Node = None          # First node
         self._last: GroupedList._Node = None           # Last node
         self._node_count: int = 0                    # Count of nodes
-        self._first_head: GroupedList._Node = None     # First node that is a group head
-        self._last_head: GroupedList._Node = None      # Last node that is a group head
+        self._first_head: GroupedList._Node = None     # First group head
+        self._last_head: GroupedList._Node = None      # Last group head
         self._group_count: int = 0                   # Count of groups
+        self._group_heads_cache: list = None         # Group heads in list order, or None if not yet built
+        self._finger: tuple = None                   # (index, node) most recently found by _node_at()
+
+    def _clear_group_heads(self):
+        '''Removes all group heads, leaving the list with no groups.'''
+        group_head = self._first_head
+        while group_head is not None:
+            next_head = group_head.next_head
+            group_head.clear_group_head()
+            group_head = next_head
+        self._first_head = None
+        self._last_head = None
+        self._group_count = 0
+        self._group_heads_cache = None
 
     def clear_groups(self):
         '''Clears all existing groups and replaces them with a single new group containing all the items
         in the list.'''
-        for node in self._node_iter():
-            node.clear_group_head()
+        self._clear_group_heads()
         self._setup_single_group()
 
     def reverse(self):
@@ -550,83 +647,129 @@ class GroupedList(MutableSequence):
         node = self._last
         while node is not None:
             (node.next, node.prev) = (node.prev, node.next) # Swap next and prev links
-            # Clear groups:
-            node.clear_group_head()
             node = node.next
         (self._first, self._last) = (self._last, self._first) # Swap first and last links
-        self._setup_single_group()
+        self._finger = None
+        self.clear_groups()
 
     #
     # Sort-related methods
     #
 
-    def sort(self):
+    def sort(self, key=None):
         '''Sorts this list in-place. All existing groups are cleared and replaced with a single
-        new group.'''
-        (self._first, self._last) = self._merge_sort(self._first, clear_group_heads=True)
+        new group.
+
+        If `key` is given, it is called once for each item, and the items are sorted by the results, as for
+        `list.sort()`. The sort is stable.'''
+        self._clear_group_heads()
+        self._finger = None
+        if key is None:
+            (self._first, self._last) = self._merge_sort(self._first)
+        else:
+            self._sort_by_key(key)
         self._setup_single_group()
 
-    def _merge_sort(self, first_node: 'GroupedList._Node', clear_group_heads=False):
+    def _sort_by_key(self, key):
+        '''Sorts the nodes using the built-in list sort, with keys computed from their values, and relinks them.'''
+        nodes = []
+        node = self._first
+        while node is not None:
+            nodes.append(node)
+            node = node.next
+        if len(nodes) == 0:
+            return
+        nodes.sort(key=lambda node: key(node.value))
+        prev_node = None
+        for node in nodes:
+            node.prev = prev_node
+            if prev_node is not None:
+                prev_node.next = node
+            prev_node = node
+        prev_node.next = None
+        self._first = nodes[0]
+        self._last = prev_node
+
+    def _merge_sort(self, first_node: 'GroupedList._Node'):
         '''Sorts a list beginning with `first_node`, and returns a tuple of (new_first_node, new_last_node).
+
+        This is a bottom-up merge sort: adjacent sorted runs of length 1, 2, 4, etc. are merged in turn, so
+        no recursion is needed, even for long lists.
         '''
         if first_node is None or first_node.next is None:
             return (first_node, first_node)
-        
-        first_node_A = first_node
-        first_node_B = self._split(first_node, clear_group_heads)
-        (first_node_A, last_node_A) = self._merge_sort(first_node_A, clear_group_heads=False)
-        (first_node_B, last_node_B) = self._merge_sort(first_node_B, clear_group_heads=False)
-
-        (new_first_node, new_last_node) = self._merge_sublists(first_node_A, last_node_A, 
-                                                               first_node_B, last_node_B)
-        return (new_first_node, new_last_node)
-
-    def _split(self, first_node: 'GroupedList._Node', clear_group_heads=False):
-        '''Given the first node of a sublist, splits the list in half and returns the first
-        node of the second half.'''
-        slow_node = first_node
-        if clear_group_heads:
-            slow_node.clear_group_head()
-        fast_node = first_node.next
-
-        while fast_node is not None:
-            if clear_group_heads:
-                fast_node.clear_group_head()            
-            fast_node = fast_node.next
-            if fast_node is not None:
-                if clear_group_heads:
-                    fast_node.clear_group_head()            
-                slow_node = slow_node.next
-                fast_node = fast_node.next
-        
-        first_node_B = slow_node.next
-        slow_node.next = None
-        first_node_B.prev = None
-        return first_node_B
-
-    def _merge_sublists(self, first_node_A: 'GroupedList._Node', last_node_A: 'GroupedList._Node',
-                              first_node_B: 'GroupedList._Node', last_node_B: 'GroupedList._Node'):
-        '''Combines two sublists (A and B) into a single sorted list. Returns a tuple of
-        (new_first_node, new_last_node)'''
-        if first_node_A is None:
-            return (first_node_B, last_node_B)
+
+        width = 1
+        while True:
+            remaining_node = first_node
+            new_first_node = None
+            new_last_node = None
+            merge_count = 0
+            while remaining_node is not None:
+                first_node_A = remaining_node
+                first_node_B = self._split(first_node_A, width)
+                remaining_node = self._split(first_node_B, width)
+                (merged_first_node, merged_last_node) = self._merge_sublists(first_node_A, first_node_B)
+                if new_last_node is None:
+                    new_first_node = merged_first_node
+                else:
+                    new_last_node.next = merged_first_node
+                    merged_first_node.prev = new_last_node
+                new_last_node = merged_last_node
+                merge_count += 1
+            first_node = new_first_node
+            if merge_count == 1:
+                return (new_first_node, new_last_node)
+            width *= 2
+
+    def _split(self, first_node: 'GroupedList._Node', count: int):
+        '''Given the first node of a sublist, splits off the first `count` nodes and returns the first
+        node of the remainder (or `None` if there is no remainder).'''
+        if first_node is None:
+            return None
+        node = first_node
+        for _ in range(count - 1):
+            if node.next is None:
+                return None
+            node = node.next
+        remainder_node = node.next
+        node.next = None
+        if remainder_node is not None:
+            remainder_node.prev = None
+        return remainder_node
+
+    def _merge_sublists(self, first_node_A: 'GroupedList._Node', first_node_B: 'GroupedList._Node'):
+        '''Combines two sorted sublists (A and B) into a single sorted list. Returns a tuple of
+        (new_first_node, new_last_node). Where nodes are equal, those from A come first.'''
         if first_node_B is None:
+            last_node_A = first_node_A
+            while last_node_A.next is not None:
+                last_node_A = last_node_A.next
             return (first_node_A, last_node_A)
-        
-        if first_node_A <=  first_node_B: # Nodes compare using their values
-            (next_first_node, new_last_node) = self._merge_sublists(first_node_A.next, last_node_A,
-                                                                    first_node_B, last_node_B)
-            first_node_A.next = next_first_node
-            next_first_node.prev = first_node_A
-            first_node_A.prev = None
-            return (first_node_A, new_last_node)
-        else: # first_node_B is less than first_node_A
-            (next_first_node, new_last_node) = self._merge_sublists(first_node_A, last_node_A,
-                                                                    first_node_B.next, last_node_B)
-            first_node_B.next = next_first_node
-            next_first_node.prev = first_node_B
-            first_node_B.prev = None
-            return (first_node_B, new_last_node)
+
+        new_first_node = None
+        new_last_node = None
+        while first_node_A is not None and first_node_B is not None:
+            if first_node_A <= first_node_B: # Nodes compare using their values
+                node = first_node_A
+                first_node_A = first_node_A.next
+            else: # first_node_B is less than first_node_A
+                node = first_node_B
+                first_node_B = first_node_B.next
+            node.prev = new_last_node
+            if new_last_node is None:
+                new_first_node = node
+            else:
+                new_last_node.next = node
+            new_last_node = node
+
+        # Append whichever sublist has nodes remaining
+        rest_node = first_node_A if first_node_A is not None else first_node_B
+        new_last_node.next = rest_node
+        rest_node.prev = new_last_node
+        while rest_node.next is not None:
+            rest_node = rest_node.next
+        return (new_first_node, rest_node)
 
     #
     # End of sort-related methods
@@ -657,15 +800,14 @@ class GroupedList(MutableSequence):
                 return False
             if self._group_count != other_iterable._group_count:
                 return False
-            self_groups = list(self.groups)
-            other_groups = list(other_iterable.groups)
-            for i in range(len(self_groups)):
-                try:
-                    for self_item, other_item in zip(list(self_groups[i]), list(other_groups[i]), strict=True):
-                        if self_item != other_item:
-                            return False
-                except ValueError:
+            # Walk both lists together. As the lengths match, the groups match if their heads line up.
+            self_node = self._first
+            other_node = other_iterable._first
+            while self_node is not None:
+                if self_node.is_group_head != other_node.is_group_head or self_node.value != other_node.value:
                     return False
+                self_node = self_node.next
+                other_node = other_node.next
         else:
             for self_item, other_item in zip(self, other_iterable):
                 if self_item != other_item:
@@ -707,6 +849,11 @@ class GroupedList(MutableSequence):
         return str(self.to_nested_lists())
 
 
+# GroupedList implements the full MutableSequence interface itself, so it is registered as a virtual
+# subclass rather than inheriting the ABC's mixin methods.
+MutableSequence.register(GroupedList)
+
+
 class GroupViewError(BibleRefException):
     '''Raised when a no-longer-valid GroupView is accessed.'''
 
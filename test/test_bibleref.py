@@ -1,7 +1,7 @@
 
 import unittest
 
-from bibleref import bible_data, BibleRangeList
+from bibleref import bible_data, BibleRange, BibleRangeList
 
 
 class TestBibleRef(unittest.TestCase):
@@ -32,3 +32,46 @@ class TestBibleRef(unittest.TestCase):
         bible_data().minor_list_sep = minor_list_sep
         bible_data().verse_sep_std = verse_sep_std
         bible_data().verse_sep_alt = verse_sep_alt
+
+    def test_bible_data_batch_update(self):
+        range_sep = bible_data().range_sep
+        verse_sep_std = bible_data().verse_sep_std
+        expected = BibleRangeList([[BibleRange("Mark 3-4:2")]])
+
+        with bible_data().batch_update():
+            bible_data().range_sep = "_"
+            bible_data().verse_sep_std = "*"
+            # Parser isn't rebuilt until the end of the batch
+            self.assertEqual(BibleRangeList("Mark 3:1-4:2"), expected)
+
+        self.assertEqual(BibleRangeList("Mark 3*1_4*2"), expected)
+
+        with bible_data().batch_update():
+            bible_data().range_sep = range_sep
+            bible_data().verse_sep_std = verse_sep_std
+
+        self.assertEqual(BibleRangeList("Mark 3:1-4:2"), expected)
+
+    def test_bible_data_special_separators(self):
+        separators = (bible_data().range_sep, bible_data().major_list_sep, bible_data().minor_list_sep,
+                      bible_data().verse_sep_std, bible_data().verse_sep_alt)
+        range_list_1 = BibleRangeList("Mark 3:1-4:2; 5:6-8, 10; Matt 4")
+
+        # Characters that are special in regexes or Lark string literals
+        with bible_data().batch_update():
+            bible_data().range_sep = "\\"
+            bible_data().major_list_sep = "]"
+            bible_data().minor_list_sep = '"'
+            bible_data().verse_sep_std = "^"
+            bible_data().verse_sep_alt = "/"
+        self.assertEqual(BibleRangeList('Mark 3^1\\4/2] 5^6\\8" 10] Matt 4'), range_list_1)
+
+        # Letters that would form regex escapes such as \d and \w
+        with bible_data().batch_update():
+            bible_data().range_sep = "d"
+            bible_data().verse_sep_std = "w"
+        self.assertEqual(BibleRangeList('Mark 3w1d4/2] 5w6d8" 10] Matt 4'), range_list_1)
+
+        with bible_data().batch_update():
+            (bible_data().range_sep, bible_data().major_list_sep, bible_data().minor_list_sep,
+             bible_data().verse_sep_std, bible_data().verse_sep_alt) = separators
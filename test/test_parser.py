@@ -1,8 +1,14 @@
+from concurrent.futures import ThreadPoolExecutor
 from pprint import pprint
+import random
 import unittest
 
+from lark.exceptions import UnexpectedInput, VisitError
+
+from bibleref import bible_data
 from bibleref.ref import BibleBook, BibleRange, BibleRefParsingError
-from bibleref.parser import _parse
+from bibleref import parser
+from bibleref.parser import _parse, _parse_uncached, _BibleRefTransformer, _thread_scanner
 
 class TestBibleParser(unittest.TestCase):
     def test_parse_success(self):
@@ -45,4 +51,86 @@ class TestBibleParser(unittest.TestCase):
         self.assertIsNotNone(error)
         self.assertEqual(error.start_pos, 8)
         self.assertEqual(error.end_pos, 10)
-        
\ No newline at end of file
+        
+        # Input that ends unexpectedly is reported at the last token
+        error = None
+        try:
+            _parse("Mark 2:")
+        except BibleRefParsingError as e:
+            error = e
+
+        self.assertIsNotNone(error)
+        self.assertEqual(error.start_pos, 6)
+        self.assertEqual(error.end_pos, 7)
+
+    def test_parse_state_reset(self):
+        # The implied book of one parse must not carry over into the next
+        _parse("Mark 2")
+        with self.assertRaises(BibleRefParsingError):
+            _parse("3")
+
+    def test_parse_cache(self):
+        expected_list = [[BibleRange("Mark 2")], [BibleRange("Mark 3")]]
+        range_groups_list = _parse("Mark 2; 3")
+        self.assertEqual(range_groups_list, expected_list)
+
+        # Changing a result doesn't change the cached copy
+        range_groups_list[0].clear()
+        self.assertEqual(_parse("Mark 2; 3"), expected_list)
+
+        # Changing the Bible data discards cached results
+        major_list_sep = bible_data().major_list_sep
+        bible_data().major_list_sep = "|"
+        try:
+            with self.assertRaises(BibleRefParsingError):
+                _parse("Mark 2; 3")
+        finally:
+            bible_data().major_list_sep = major_list_sep
+
+    def test_parse_threads(self):
+        # Each thread has its own transformer state, so concurrent parses don't interfere
+        strings = ["Mark 2; 3", "Jude 5, 8", "John 3:16-18, 20", "Gen 1; 4:2"] * 50
+        expected_list = [_parse(string) for string in strings]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            range_groups_lists = list(executor.map(lambda string: _parse_uncached(string, None), strings))
+        self.assertEqual(range_groups_lists, expected_list)
+
+    def test_scanner_matches_lark(self):
+        # The hand-written scanner should accept exactly the strings the Lark grammar accepts, and
+        # transform them to the same result, so the Lark fallback in _parse_uncached() is never needed
+        # for a valid string.
+        pieces = ["Mark", "Gen", "1 John", "Song of Songs", "Jude", "Obadiah", "Rom", "Xyz", "3John",
+                  "1", "2", "3", "16", "150", "0",
+                  ":", ".", "-", ";", ",", " ", "  ", "\t", "!", ""]
+        rng = random.Random(1234)
+        scanner = _thread_scanner()
+        transformer = _BibleRefTransformer()
+        for _ in range(3000):
+            string = "".join(rng.choice(pieces) for _ in range(rng.randint(1, 8)))
+            try:
+                tree = parser._parser_obj.parse(string)
+            except UnexpectedInput:
+                tree = None
+
+            scanner.reset(None)
+            try:
+                scan_result = scanner.scan(string)
+            except Exception as e:
+                scan_result = e
+
+            if tree is None:
+                # Lark rejects the string, so the scanner must too
+                self.assertIsInstance(scan_result, Exception, string)
+                continue
+
+            transformer.reset(None)
+            try:
+                lark_result = transformer.transform(tree)
+            except VisitError as e:
+                self.assertIsInstance(e.orig_exc, BibleRefParsingError, string)
+                self.assertIsInstance(scan_result, BibleRefParsingError, string)
+                self.assertEqual((scan_result.start_pos, scan_result.end_pos),
+                                 (e.orig_exc.start_pos, e.orig_exc.end_pos), string)
+                continue
+            self.assertNotIsInstance(scan_result, Exception, string)
+            self.assertEqual(scan_result, lark_result, string)
@@ -1,3 +1,5 @@
+import copy
+import pickle
 import unittest
 
 import bibleref
@@ -11,6 +13,12 @@ class TestBibleReference(unittest.TestCase):
         self.assertEqual(BibleBook.from_str("Gen"), BibleBook.Gen)
         self.assertEqual(BibleBook.from_str("Mt"), BibleBook.Matt)
         self.assertEqual(BibleBook.from_str("Rev"), BibleBook.Rev)
+        self.assertEqual(BibleBook.from_str(" iii  JOH "), BibleBook.IIIJn)
+        self.assertEqual(BibleBook.from_str("1sm"), BibleBook.ISam)
+        self.assertEqual(BibleBook.from_str("Song of\tSol"), BibleBook.Song)
+        self.assertEqual(BibleBook.from_str("SongofSol"), BibleBook.Song)
+        self.assertIsNone(BibleBook.from_str("IJohn"))
+        self.assertIsNone(BibleBook.from_str("Revelations"))
 
     def test_bible_book_ranges(self):
         self.assertEqual(BibleBook.Matt.range(), BibleRange("Matt 1:1-28:20"))
@@ -21,6 +29,28 @@ class TestBibleReference(unittest.TestCase):
         for book in BibleBook:
             self.assertEqual(book.verse_count(), BibleRange(book.title).verse_count())
             self.assertEqual(book.chap_count(), BibleRange(book.title).chap_count())
+        self.assertEqual(BibleBook.Psa.verse_count(), 2461)
+        self.assertEqual(BibleBook.Psa.verse_count(flags=BibleFlag.VERSE_0), 2577) # Includes 116 verse 0s
+
+    def test_bible_book_next_prev(self):
+        self.assertEqual(BibleBook.Matt.next(), BibleBook.Mark)
+        self.assertEqual(BibleBook.Mark.prev(), BibleBook.Matt)
+        self.assertIsNone(BibleBook.Gen.prev())
+        self.assertIsNone(BibleBook.Rev.next())
+
+    def test_bible_book_max_verses(self):
+        max_verses = bibleref.bible_data().max_verses
+        for book in BibleBook:
+            self.assertEqual(book.chap_count(), len(max_verses[book]))
+            for chap_num, max_verse in enumerate(max_verses[book], start=1):
+                self.assertEqual(book.max_verse_num(chap_num), max_verse)
+        self.assertEqual(BibleBook.Psa.max_verse_num(119), 176)
+        # The data can only be changed by assigning new data, not by editing it in place
+        with self.assertRaises(TypeError):
+            max_verses[BibleBook.Jude][0] = 30
+        with self.assertRaises(TypeError):
+            max_verses[BibleBook.Jude] = [30]
+        self.assertEqual(BibleBook.Jude.max_verse_num(1), 25)
 
     def test_bible_book_chap_ranges(self):
         self.assertEqual(BibleBook.Mark.chap_ranges(),
@@ -83,6 +113,8 @@ class TestBibleReference(unittest.TestCase):
         self.assertEqual(verse_with_1.verse_1_to_0(), verse_with_0)
         self.assertEqual(no_verse_0.verse_0_to_1(), no_verse_0)
         self.assertEqual(no_verse_0.verse_1_to_0(), no_verse_0)
+        self.assertEqual(BibleBook.Psa.first_verse(3, flags=BibleFlag.VERSE_0), verse_with_0)
+        self.assertEqual(BibleBook.Psa.first_verse(3), verse_with_1)
 
     def test_bible_verse_bool_tests(self):
         self.assertTrue(BibleVerse(BibleBook.Matt, 2, 1).is_first_in_chap())
@@ -100,6 +132,19 @@ class TestBibleReference(unittest.TestCase):
         self.assertEqual(bible_verse.chap_range(), BibleRange("Matt 3"))
         self.assertEqual(bible_verse.book_range(), BibleRange("Matt"))
 
+    def test_copy_and_pickle(self):
+        bible_verse = BibleVerse("Matt 3:8")
+        bible_range = BibleRange("Matt 3:8-4:2")
+        range_list = BibleRangeList("Matt 3:8-4:2; Mark 1")
+        for obj in (bible_verse, bible_range, range_list):
+            self.assertEqual(copy.copy(obj), obj)
+            self.assertEqual(copy.deepcopy(obj), obj)
+            self.assertEqual(pickle.loads(pickle.dumps(obj)), obj)
+        for obj in (bible_verse, bible_range):
+            self.assertEqual(hash(copy.deepcopy(obj)), hash(obj))
+            self.assertEqual(hash(pickle.loads(pickle.dumps(obj))), hash(obj))
+        self.assertEqual(len({BibleVerse("Matt 3:8"), bible_verse, bible_range.start}), 1)
+
     def test_verse_arithmetic(self):
         self.assertEqual(BibleVerse("Ps 3:8") + 1, BibleVerse("Ps 4:1"))
         self.assertEqual(BibleVerse("Ps 4:1") - 1, BibleVerse("Ps 3:8"))
@@ -113,6 +158,12 @@ class TestBibleReference(unittest.TestCase):
                          flags=BibleFlag.VERSE_0), -1)
         self.assertEqual(BibleVerse("Ps 4:0", flags=BibleFlag.VERSE_0).subtract(BibleVerse("Ps 3:8"),
                          flags=BibleFlag.VERSE_0), 1)
+        # Jumps across several chapters count each chapter's verse 0
+        self.assertEqual(BibleVerse("Ps 13:4").subtract(30, flags=BibleFlag.VERSE_0),
+                         BibleVerse("Ps 10:10", flags=BibleFlag.VERSE_0))
+        for n in (1, 4, 5, 12, 30, 100):
+            verse = BibleVerse("Ps 13:4")
+            self.assertEqual(verse.subtract(n, flags=BibleFlag.VERSE_0).add(n, flags=BibleFlag.VERSE_0), verse)
         
         self.assertEqual(BibleVerse("John 1:50") + 11, BibleVerse("John 2:10"))
         self.assertEqual(BibleVerse("John 1:50") - BibleVerse("John 2:10"), -11)
@@ -122,6 +173,20 @@ class TestBibleReference(unittest.TestCase):
         self.assertEqual(BibleVerse("John 2:10") - BibleVerse("John 1:49"), 12)
         self.assertEqual(BibleVerse("John 1:49") - BibleVerse("John 2:10"), -12)
 
+        # Long jumps, within and across books
+        self.assertEqual(BibleVerse("Isa 1:1") + 1000, BibleVerse("Isa 49:19"))
+        self.assertEqual(BibleVerse("Isa 49:19") - 1000, BibleVerse("Isa 1:1"))
+        self.assertEqual(BibleVerse("Gen 1:1").add(BibleBook.Gen.verse_count(), flags=BibleFlag.MULTIBOOK),
+                         BibleVerse("Exod 1:1"))
+        self.assertEqual(BibleVerse("Exod 1:1").subtract(BibleBook.Gen.verse_count(), flags=BibleFlag.MULTIBOOK),
+                         BibleVerse("Gen 1:1"))
+        self.assertIsNone(BibleVerse("Gen 1:1").add(BibleBook.Gen.verse_count()))
+
+        self.assertEqual(BibleVerse("Ps 119:100") - BibleVerse("Ps 3:4"),
+                         BibleRange("Ps 3:4-119:100").verse_count() - 1)
+        self.assertEqual(BibleVerse("Ps 3:4") - BibleVerse("Ps 119:100", flags=BibleFlag.VERSE_0),
+                         1 - BibleRange("Ps 3:4-119:100").verse_count(flags=BibleFlag.VERSE_0))
+
     def test_bible_verse_to_string(self):
         verse = BibleVerse(BibleBook.Matt, 5, 3)
         self.assertEqual(str(verse), "Matthew 5:3")
@@ -333,6 +398,14 @@ class TestBibleReference(unittest.TestCase):
         self.assertEqual(bible_range.book_count(), 1)
         self.assertEqual(bible_range.book_count(whole=True), 0)
 
+        # Range starting at a verse 0, so that verse 0s are counted
+        bible_range = BibleRange("Psa 29:0-Matt 28:1", flags=BibleFlag.MULTIBOOK | BibleFlag.VERSE_0)
+        self.assertEqual(bible_range.verse_count(), 9979)
+        self.assertEqual(bible_range.chap_count(), 451)
+        self.assertEqual(bible_range.chap_count(whole=True), 449)
+        self.assertEqual(bible_range.book_count(), 22)
+        self.assertEqual(bible_range.book_count(whole=True), 20)
+
     def test_range_split(self):
         ref = BibleRange("Matt 1:5-John 10:11", flags=BibleFlag.MULTIBOOK)
         split = ref.split()
@@ -727,6 +800,19 @@ class TestBibleReference(unittest.TestCase):
         list_2 = BibleRangeList("John 12-15; Luke 12-15; Mark 1-3; Matt 15-16")
         self.assertEqual(list_1 & list_2, BibleRangeList("Luke 12; John 14-15"))
 
+        # Overlapping ranges, where a later range ends before an earlier one
+        list_2 = BibleRangeList("Matt 1-10; Matt 3:2-4; Mark 7:5; Mark 1-6:3")
+        self.assertEqual(list_1 & list_2, BibleRangeList("Matt 2-4; Mark 6:1-3; 7:5"))
+        self.assertEqual(list_2 & list_1, BibleRangeList("Matt 2-4; Mark 6:1-3; 7:5"))
+
+        # Without MULTIBOOK, the error names the first multi-book intersection in list order
+        list_1 = BibleRangeList("Luke-John; Matt-Mark", flags=BibleFlag.MULTIBOOK)
+        list_2 = BibleRangeList("Matt-John", flags=BibleFlag.MULTIBOOK)
+        self.assertRaisesRegex(MultibookRangeNotAllowedError, r"\(Luke and John are different\)",
+                               lambda: list_1 & list_2)
+        self.assertRaisesRegex(MultibookRangeNotAllowedError, r"\(Luke and John are different\)",
+                               lambda: list_2 & list_1)
+
     def test_bible_range_list_difference(self):
         list_1 = BibleRangeList("Matt 2-4; Mark 6-8; Luke 10-12; John 14-18")
         
@@ -1,19 +1,39 @@
+from collections.abc import MutableSequence
 import unittest
 
 from bibleref.util import GroupedList, GroupViewError
 
 
+class MutableKey:
+    '''A hashable value whose hash changes when it is mutated.'''
+    def __init__(self, v):
+        self.v = v
+
+    def __eq__(self, other):
+        return isinstance(other, MutableKey) and self.v == other.v
+
+    def __hash__(self):
+        return hash(self.v)
+
+    def __repr__(self):
+        return f"MutableKey({self.v})"
+
+
 class TestGroupedList(unittest.TestCase):    
     def test_construction(self):
         self.assertListEqual(list(GroupedList()), [])
         self.assertListEqual(list(GroupedList([1])), [1])
         test_list = GroupedList([5, 8, 2, 7, 3, 10])
         self.assertListEqual(list(test_list), [5, 8, 2, 7, 3, 10])
+        self.assertIsInstance(test_list, MutableSequence)
     
     def test_conform_index(self):
         test_list = GroupedList([5, 8, 2, 7, 3, 10])
         self.assertEqual(test_list._conform_index(-2), -2 + len(test_list))
         self.assertRaises(IndexError, lambda: test_list._conform_index(len(test_list)))
+        self.assertRaises(IndexError, lambda: test_list._conform_index(-len(test_list) - 1))
+        self.assertRaises(IndexError, lambda: test_list[-10])
+        self.assertRaises(IndexError, lambda: test_list.groups[-2])
     
     def test_node_at(self):
         test_list = GroupedList([5, 8, 2, 7, 3, 10])
@@ -60,6 +80,24 @@ class TestGroupedList(unittest.TestCase):
         self.assertListEqual(list(test_list), [8,2,7,3])
         self.assertEqual(len(test_list), 4)
 
+    def test_remove_during_iteration(self):
+        test_list = GroupedList([1, 2, 3, 4, 5, 6])
+        seen = []
+        for value in test_list:
+            seen.append(value)
+            if value == 2:
+                test_list.remove(2)
+        self.assertListEqual(seen, [1, 2, 3, 4, 5, 6])
+        self.assertListEqual(list(test_list), [1, 3, 4, 5, 6])
+
+        test_list = GroupedList([1, 2, 3, 4, 5, 6])
+        seen = []
+        for value in reversed(test_list):
+            seen.append(value)
+            if value == 5:
+                test_list.remove(5)
+        self.assertListEqual(seen, [6, 5, 4, 3, 2, 1])
+
     def test_pop_before(self):
         test_list = GroupedList([5, 8, 2, 7, 3, 10])
         self.assertRaises(IndexError, lambda: test_list._pop_before(test_list._node_at(0)))
@@ -129,6 +167,14 @@ class TestGroupedList(unittest.TestCase):
         test_list = GroupedList([5, 8, 2, 7, 3, 10])
         test_list.clear()
         self.assertListEqual(list(test_list), [])
+
+        # An iterator paused before the clear still sees the items it was iterating over
+        test_list = GroupedList([1, 2, 3])
+        it = iter(test_list)
+        next(it)
+        test_list.clear()
+        test_list.extend([10, 20, 30])
+        self.assertListEqual(list(it), [2, 3])
     
     def test_len(self):
         test_list = GroupedList([5, 8, 2, 7, 3, 10])
@@ -168,12 +214,73 @@ class TestGroupedList(unittest.TestCase):
         test_list = GroupedList([5, 8, 2, 7, 3, 10])
         test_list.extend([12, 9, 20])
         self.assertListEqual(list(test_list), [5, 8, 2, 7, 3, 10, 12, 9, 20])
+        test_list = GroupedList([[5, 8], [2]])
+        test_list.extend(test_list)
+        self.assertEqual(test_list.to_nested_lists(), [[5, 8], [2, 5, 8, 2]])
+        test_list = GroupedList()
+        test_list.extend([3, 1])
+        self.assertEqual(test_list.to_nested_lists(), [[3, 1]])
+        self.assertEqual(test_list.index(1), 1)
     
     def test_remove(self):
         test_list = GroupedList([5, 8, 2, 7, 3, 10, 2])
         test_list.remove(2)
         self.assertListEqual(list(test_list), [5, 8, 7, 3, 10, 2])
 
+    def test_value_lookup(self):
+        test_list = GroupedList([2, 5, 8, 2, 7])
+        test_list.prepend(7)
+        test_list[2] = 9
+        self.assertListEqual(list(test_list), [7, 2, 9, 8, 2, 7])
+        self.assertTrue(9 in test_list)
+        self.assertFalse(5 in test_list)
+        self.assertEqual(test_list.index(7), 0)
+        self.assertEqual(test_list.index(7, 1), 5)
+        self.assertEqual(test_list.count(7), 2)
+        self.assertEqual(test_list.count(5), 0)
+        test_list.remove(7)
+        test_list.remove(2)
+        self.assertListEqual(list(test_list), [9, 8, 2, 7])
+        self.assertEqual(test_list.index(2), 2)
+        self.assertRaises(ValueError, lambda: test_list.remove(5))
+
+        # Unhashable values can be found too
+        test_list.append([1, 2])
+        self.assertTrue([1, 2] in test_list)
+        self.assertEqual(test_list.index([1, 2]), 4)
+        self.assertEqual(test_list.count(2), 1)
+        test_list.remove(8)
+        self.assertListEqual(list(test_list), [9, 2, 7, [1, 2]])
+
+    def test_mutated_value_lookup(self):
+        # Values mutated after insertion are found by their current value
+        k = MutableKey(2)
+        test_list = GroupedList([[k, MutableKey(3)]])
+        k.v = 3
+        self.assertTrue(MutableKey(3) in test_list)
+        self.assertFalse(MutableKey(2) in test_list)
+        self.assertEqual(test_list.index(MutableKey(3)), 0)
+        self.assertEqual(test_list.index(MutableKey(3), 1), 1)
+        test_list.remove(MutableKey(3))
+        self.assertEqual(len(test_list), 1)
+        self.assertIsNot(test_list[0], k)
+        self.assertRaises(ValueError, lambda: test_list.remove(MutableKey(2)))
+
+        k = MutableKey(1)
+        test_list = GroupedList([MutableKey(2), k])
+        k.v = 5
+        self.assertEqual(test_list.index(MutableKey(5)), 1)
+        self.assertIs(test_list.pop(1), k)
+        self.assertListEqual(list(test_list), [MutableKey(2)])
+
+    def test_mutated_value_count(self):
+        k = MutableKey(2)
+        test_list = GroupedList([[k, MutableKey(3)]])
+        k.v = 3
+        self.assertEqual(test_list.count(MutableKey(3)), 2)
+        self.assertEqual(test_list.count(MutableKey(2)), 0)
+        self.assertEqual(test_list.count(k), 2)
+
     def test_reverse(self):
         test_list = GroupedList([5, 8, 2, 7, 3, 10])
         test_list.reverse()
@@ -188,6 +295,14 @@ class TestGroupedList(unittest.TestCase):
         test_list = GroupedList([[2, 8, 4], [1, 9, 6], [3, 7, 5]])
         self.assertEqual(test_list.to_nested_lists(), [[2, 8, 4], [1, 9, 6], [3, 7, 5]])
 
+    def test_mixed_construction(self):
+        test_list = GroupedList([1, 2, [3, 4], [], 5, 6, (7,), 8])
+        self.assertEqual(test_list.to_nested_lists(), [[1, 2], [3, 4, 5, 6], [7, 8]])
+        self.assertEqual(test_list.index(6), 5)
+        test_list.append_group([9, 10])
+        self.assertEqual(test_list.to_nested_lists(), [[1, 2], [3, 4, 5, 6], [7, 8], [9, 10]])
+        self.assertEqual(test_list.groups[3].group_head.value, 9)
+
     def test_groups_view(self):
         test_list = GroupedList([[2, 8, 4], [1, 9, 6], [3, 7, 5]])
         self.assertEqual(len(test_list.groups), 3)
@@ -241,6 +356,51 @@ class TestGroupedList(unittest.TestCase):
         self.assertEqual(len(test_list.groups), 1)
         self.assertEqual(test_list.to_nested_lists(), [[2, 8, 4]])
 
+    def test_group_deletion_during_iteration(self):
+        test_list = GroupedList([[1, 2], [3, 4], [5, 6], [7, 8]])
+        seen = []
+        for group in test_list.groups:
+            seen.append(list(group))
+            if group[0] == 3:
+                # Remove the current group entirely
+                del test_list[2]
+                del test_list[2]
+        self.assertEqual(seen, [[1, 2], [3, 4], [5, 6], [7, 8]])
+        self.assertEqual(test_list.to_nested_lists(), [[1, 2], [5, 6], [7, 8]])
+
+        test_list = GroupedList([[1, 2], [3, 4], [5, 6], [7, 8]])
+        seen = []
+        for group in test_list.groups:
+            seen.append(list(group))
+            if group[0] == 1:
+                # Remove the following group entirely
+                del test_list[2]
+                del test_list[2]
+        self.assertEqual(seen, [[1, 2], [5, 6], [7, 8]])
+
+    def test_front_group_removal(self):
+        # Removing groups from the front of a long list updates the group heads in O(1) time per pop
+        test_list = GroupedList([[i, i + 1] for i in range(0, 2000, 2)])
+        self.assertEqual(len(test_list.groups), 1000)
+        for i in range(0, 1998, 2):
+            self.assertEqual(test_list.pop(0), i)
+            self.assertEqual(list(test_list.groups[0]), [i + 1])
+            self.assertEqual(test_list.pop(0), i + 1)
+        self.assertEqual(test_list.to_nested_lists(), [[1998, 1999]])
+        self.assertIs(test_list._first_head, test_list._first)
+        self.assertIs(test_list._last_head, test_list._first)
+        self.assertEqual(test_list._group_heads, [test_list._first])
+
+    def test_group_head_reuse(self):
+        test_list = GroupedList([[2, 8, 4], [1, 9, 6]])
+        group_1 = test_list.groups[1]
+        del test_list[3]
+        self.assertRaises(GroupViewError, lambda: group_1[0])
+        # Adding a new group after the pop doesn't revive old views of the popped head
+        test_list.append(5, new_group=True)
+        self.assertEqual(test_list.to_nested_lists(), [[2, 8, 4], [9, 6], [5]])
+        self.assertRaises(GroupViewError, lambda: group_1[0])
+
     def test_group_prepend(self):
         test_list = GroupedList([[2, 8, 4], [1, 9, 6]])
         self.assertEqual(test_list.to_nested_lists(), [[2, 8, 4], [1, 9, 6]])
@@ -291,6 +451,26 @@ class TestGroupedList(unittest.TestCase):
         self.assertIs(test_list._first_head, test_list._node_at(0))
         self.assertIs(test_list._last_head, test_list._node_at(2))
 
+    def test_group_heads(self):
+        test_list = GroupedList([[2, 8, 4], [1, 9, 6]])
+        self.verify_group_heads(test_list, [0, 3])
+        test_list._insert_before(test_list._node_at(3), 5, new_group=True)
+        self.verify_group_heads(test_list, [0, 3, 4])
+        test_list.pop(0)
+        self.verify_group_heads(test_list, [0, 2, 3])
+        test_list.pop(2)
+        self.verify_group_heads(test_list, [0, 2])
+        test_list.clear_groups()
+        self.verify_group_heads(test_list, [0])
+        test_list.clear()
+        self.verify_group_heads(test_list, [])
+
+    def verify_group_heads(self, linked_list: GroupedList, head_indices: list):
+        group_heads = linked_list._group_heads
+        self.assertEqual(len(group_heads), len(head_indices))
+        for group_head, index in zip(group_heads, head_indices):
+            self.assertIs(group_head, linked_list._node_at(index))
+
     def test_group_item_modify(self):
         test_list = GroupedList([[2, 8, 4], [1, 9, 6], [3, 7, 5]])
         self.assertEqual(test_list.to_nested_lists(), [[2, 8, 4], [1, 9, 6], [3, 7, 5]])
@@ -317,10 +497,20 @@ class TestGroupedList(unittest.TestCase):
         test_list.insert_group_at(7)
         self.assertEquals(test_list, GroupedList([[1, 2, 3], [4, 5, 6, 7], [8, 9, 10]]))
 
+    def test_group_insert_at_existing_head(self):
+        test_list = GroupedList([[1, 2, 3], [4, 5, 6, 7], [8, 9, 10]])
+        test_list.insert_group_at(3) # Already a group head
+        self.assertEqual(test_list, GroupedList([[1, 2, 3], [4, 5, 6, 7], [8, 9, 10]]))
+        self.assertEqual(list(test_list.groups[-1]), [8, 9, 10])
+
     def test_clear(self):
         list_1 = GroupedList([[1, 2, 3], [4, 5, 6], [7, 8], [9, 10]])
+        group_1 = list_1.groups[1]
         list_1.clear()
         self.assertTrue(list_1.equals(GroupedList()))
+        self.assertRaises(GroupViewError, lambda: group_1[0])
+        list_1.append_group([4, 5])
+        self.assertEqual(list_1.to_nested_lists(), [[4, 5]])
 
     def test_clear_groups(self):
         list_1 = GroupedList([[1, 2, 3], [4, 5, 6], [7, 8], [9, 10]])
@@ -344,6 +534,47 @@ class TestGroupedList(unittest.TestCase):
         self.assertEqual(test_list._last.value, 20)
         self.assertTrue(self.verify_is_single_group(test_list))
 
+    def test_sequential_indexing(self):
+        values = list(range(100))
+        test_list = GroupedList(values)
+        self.assertEqual([test_list[i] for i in range(100)], values)
+        self.assertEqual([test_list[i] for i in range(99, -1, -3)], values[::-3])
+        # Indexes after an insert or pop mustn't use stale positions
+        test_list.insert(50, -1)
+        self.assertEqual(test_list[51], 50)
+        test_list.pop(10)
+        self.assertEqual(test_list[50], 50)
+        self.assertEqual(test_list[49], -1)
+        # Runs of nearby inserts keep their place in the list
+        for i in range(20):
+            test_list.insert(60 + i, -2 - i)
+        self.assertEqual([test_list[i] for i in range(60, 80)], list(range(-2, -22, -1)))
+        self.assertEqual(test_list[59], 59)
+        self.assertEqual(test_list[80], 60)
+
+    def test_long_sort(self):
+        # Long lists mustn't exceed the recursion limit
+        values = [(i * 7919) % 5000 for i in range(5000)]
+        test_list = GroupedList(values)
+        test_list.sort()
+        self.assertEqual(test_list, GroupedList(sorted(values)))
+        self.assertEqual(test_list._last.value, 4999)
+        self.assertTrue(self.verify_is_single_group(test_list))
+
+    def test_sort_with_key(self):
+        test_list = GroupedList([["bb", "a"], ["ccc", "d", "ee"]])
+        test_list.sort(key=len)
+        self.assertEqual(test_list, GroupedList(["a", "d", "bb", "ee", "ccc"])) # Sort is stable
+        self.assertEqual(test_list._first.value, "a")
+        self.assertEqual(test_list._last.value, "ccc")
+        self.assertIsNone(test_list._first.prev)
+        self.assertIsNone(test_list._last.next)
+        self.assertTrue(self.verify_is_single_group(test_list))
+
+        test_list = GroupedList()
+        test_list.sort(key=len)
+        self.assertEqual(len(test_list), 0)
+
     def verify_is_single_group(self, linked_list: GroupedList):
         first = True
         for node in linked_list._node_iter():